@@ -4,36 +4,48 @@ Sample script to run the YouTube Whisper Analyzer.
 
 import os
 import sys
+import importlib.util
 
-# Add the project directory to the path
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Project directory (computed once)
+_HERE = os.path.dirname(os.path.abspath(__file__))
 
-# Try to import the CryptoBanter ASCII art
-try:
-    from src.cryptobanter import print_crypto_banter
-    cryptobanter_available = True
-except ImportError:
-    cryptobanter_available = False
+# Add the project directory to the path
+sys.path.append(_HERE)
 
-# Try to load environment variables from .env file
-try:
+def load_environment():
+    """Load environment variables from the .env file in the project root."""
+    if importlib.util.find_spec("dotenv") is None:
+        print("python-dotenv not installed. Install with: pip install python-dotenv")
+        return
+    
     from dotenv import load_dotenv
-    # Look for .env file in the project root
-    env_path = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.env')
+    env_path = os.path.join(_HERE, '.env')
     if os.path.exists(env_path):
         load_dotenv(env_path)
         print(f"Loaded environment from .env file")
     else:
         print(f"No .env file found. You may need to create one from .env.template")
-except ImportError:
-    print("python-dotenv not installed. Install with: pip install python-dotenv")
 
-from src.main import main
-
-if __name__ == "__main__":
+def main_entry():
+    """
+    Run the analyzer from the command line.
+    
+    Long-running launchers can import this module once and call main_entry()
+    repeatedly instead of paying interpreter startup per video.
+    
+    Returns:
+        int: Exit code from the analyzer
+    """
+    # Try to load environment variables from .env file
+    load_environment()
+    
     # Display the CryptoBanter ASCII art
-    if cryptobanter_available and '--no-banner' not in sys.argv:
-        print_crypto_banter()
+    if '--no-banner' not in sys.argv:
+        try:
+            from src.cryptobanter import print_crypto_banter
+            print_crypto_banter()
+        except ImportError:
+            pass
     
     # Check if API key is loaded from .env
     if not os.environ.get("GROQ_API_KEY"):
@@ -47,4 +59,8 @@ if __name__ == "__main__":
         print("     Or use 'python interactive_analyzer.py' for a fully interactive experience.\n")
     
     # Run the main function
-    exit(main()) 
\ No newline at end of file
+    from src.main import main
+    return main()
+
+if __name__ == "__main__":
+    exit(main_entry())
@@ -4,7 +4,311 @@ Module for analyzing transcripts for keyword occurrences.
 
 import re
 import json
-from collections import Counter
+import copy
+import array
+import bisect
+import hashlib
+import functools
+from collections import Counter, OrderedDict
+
+# Try to load pyahocorasick for single-pass multi-keyword matching
+try:
+    import ahocorasick
+    ahocorasick_available = True
+except ImportError:
+    ahocorasick_available = False
+
+# Try to load python-hyperscan for compiled multi-keyword scans without pyahocorasick
+try:
+    import hyperscan
+    hyperscan_available = True
+except ImportError:
+    hyperscan_available = False
+
+# Try to load numpy for vectorized word-boundary checks
+try:
+    import numpy as np
+    numpy_available = True
+except ImportError:
+    numpy_available = False
+
+# Minimum number of keywords before the NumPy word mask is built
+NUMPY_MIN_KEYWORDS = 10
+
+# Maximum number of contexts kept per keyword (None keeps every match)
+MAX_CONTEXTS = None
+
+# Maximum number of count_keywords results kept in memory
+RESULTS_CACHE_SIZE = 64
+
+# Recent count_keywords results keyed by (transcript digest, keywords)
+_results_cache = OrderedDict()
+
+# Words of three or more letters, used for related-term extraction
+_WORD_RE = re.compile(r'\b[a-z]{3,}\b')
+
+# Common stop words ignored when looking for related terms
+STOP_WORDS = frozenset({'the', 'and', 'that', 'for', 'you', 'this', 'with', 'have', 'from', 'are', 'was', 'were'})
+
+@functools.lru_cache(maxsize=4)
+def _prepare_transcript(transcript_text):
+    """
+    Lowercase a transcript and count its words, once per transcript.
+    
+    count_keywords and find_related_terms are usually called back to back on
+    the same transcript, so the result is cached for reuse.
+    
+    Args:
+        transcript_text (str): Full transcript text
+        
+    Returns:
+        tuple: (lowercase transcript, number of whitespace-separated words)
+    """
+    transcript_lower = transcript_text.lower()
+    return transcript_lower, len(transcript_lower.split())
+
+@functools.lru_cache(maxsize=4)
+def _tokenize_words(transcript_lower):
+    """
+    Extract words of three or more letters with their offsets.
+    
+    Args:
+        transcript_lower (str): Lowercase transcript text
+        
+    Returns:
+        tuple: Parallel tuples of words, start offsets and end offsets
+    """
+    word_matches = list(_WORD_RE.finditer(transcript_lower))
+    words = tuple(match.group() for match in word_matches)
+    word_starts = tuple(match.start() for match in word_matches)
+    word_ends = tuple(match.end() for match in word_matches)
+    return words, word_starts, word_ends
+
+def _is_word_char(char):
+    """Return True if char counts as a word character for regex \\b purposes."""
+    return char.isalnum() or char == '_'
+
+def _is_boundary(text, index):
+    """
+    Check whether a regex word boundary (\\b) exists at index in text.
+    
+    Args:
+        text (str): Text to inspect
+        index (int): Position between two characters
+        
+    Returns:
+        bool: True if a word boundary exists at the position
+    """
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+def _word_mask(transcript_lower):
+    """
+    Build a NumPy mask of word characters, padded with False at both ends.
+    
+    Only ASCII transcripts are supported, since byte offsets must line up with
+    string indices.
+    
+    Args:
+        transcript_lower (str): Lowercase transcript text
+        
+    Returns:
+        numpy.ndarray or None: Boolean mask of length len(text) + 2, or None
+    """
+    if not numpy_available or not transcript_lower.isascii():
+        return None
+    
+    buf = np.frombuffer(transcript_lower.encode('ascii'), dtype=np.uint8)
+    mask = np.zeros(len(buf) + 2, dtype=bool)
+    mask[1:-1] = (
+        ((buf >= ord('a')) & (buf <= ord('z')))
+        | ((buf >= ord('0')) & (buf <= ord('9')))
+        | (buf == ord('_'))
+    )
+    return mask
+
+@functools.lru_cache(maxsize=32)
+def _build_automaton(keywords_lower):
+    """
+    Build an Aho-Corasick automaton for a tuple of lowercase keywords.
+    
+    Args:
+        keywords_lower (tuple): Unique lowercase keywords
+        
+    Returns:
+        ahocorasick.Automaton: Automaton ready for iteration
+    """
+    automaton = ahocorasick.Automaton()
+    for keyword_lower in keywords_lower:
+        automaton.add_word(keyword_lower, keyword_lower)
+    automaton.make_automaton()
+    return automaton
+
+@functools.lru_cache(maxsize=32)
+def _build_union_pattern(keywords_lower):
+    """
+    Compile one regex that finds every position where any keyword starts.
+    
+    The alternation sits inside a lookahead so overlapping occurrences are all
+    reported. Longer keywords are tried first, so a hit reports the longest
+    keyword at that position; the only other keywords that can start there
+    are its prefixes, which are returned alongside.
+    
+    Args:
+        keywords_lower (tuple): Unique lowercase keywords
+        
+    Returns:
+        tuple: (compiled pattern, keywords in group order, prefix keywords per keyword)
+    """
+    ordered = sorted(keywords_lower, key=len, reverse=True)
+    alternation = '|'.join(f'(?P<k{i}>{re.escape(keyword_lower)})' for i, keyword_lower in enumerate(ordered))
+    pattern = re.compile(f'(?=(?:{alternation}))')
+    prefixes = {
+        keyword_lower: [other for other in ordered if other != keyword_lower and keyword_lower.startswith(other)]
+        for keyword_lower in ordered
+    }
+    return pattern, ordered, prefixes
+
+@functools.lru_cache(maxsize=32)
+def _build_hyperscan_database(keywords_lower):
+    """
+    Compile a Hyperscan database that reports every keyword occurrence.
+    
+    Args:
+        keywords_lower (tuple): Unique lowercase keywords
+        
+    Returns:
+        hyperscan.Database: Database ready for block-mode scanning
+    """
+    database = hyperscan.Database()
+    database.compile(
+        expressions=[re.escape(keyword_lower).encode('ascii') for keyword_lower in keywords_lower],
+        ids=list(range(len(keywords_lower))),
+        elements=len(keywords_lower)
+    )
+    return database
+
+def _find_occurrences(transcript_lower, keywords_lower):
+    """
+    Find the start position of every (possibly overlapping) keyword occurrence.
+    
+    Uses a single Aho-Corasick pass when pyahocorasick is installed, then a
+    Hyperscan scan for ASCII text when python-hyperscan is, and a single
+    alternation regex scan otherwise.
+    
+    Args:
+        transcript_lower (str): Lowercase transcript text
+        keywords_lower (tuple): Unique lowercase keywords
+        
+    Returns:
+        dict: Mapping of keyword to ascending list of start positions
+    """
+    occurrences = {keyword_lower: [] for keyword_lower in keywords_lower}
+    
+    if ahocorasick_available:
+        # Hits arrive ordered by end position, which for a single keyword is
+        # also start order
+        for end_index, keyword_lower in _build_automaton(keywords_lower).iter(transcript_lower):
+            occurrences[keyword_lower].append(end_index + 1 - len(keyword_lower))
+        return occurrences
+    
+    # Hyperscan reports byte offsets, which only match string indices for ASCII
+    if (hyperscan_available and keywords_lower and transcript_lower.isascii()
+            and all(k and k.isascii() for k in keywords_lower)):
+        starts = [occurrences[keyword_lower] for keyword_lower in keywords_lower]
+        lengths = [len(keyword_lower) for keyword_lower in keywords_lower]
+        
+        # Hits arrive ordered by end offset, which for a single keyword is
+        # also start order
+        def on_match(keyword_id, from_, to, flags, context):
+            starts[keyword_id].append(to - lengths[keyword_id])
+        
+        _build_hyperscan_database(keywords_lower).scan(
+            transcript_lower.encode('ascii'), match_event_handler=on_match
+        )
+        return occurrences
+    
+    # Otherwise, scan once with an alternation of all keywords
+    pattern, ordered, prefixes = _build_union_pattern(keywords_lower)
+    for match in pattern.finditer(transcript_lower):
+        keyword_lower = ordered[int(match.lastgroup[1:])]
+        position = match.start()
+        occurrences[keyword_lower].append(position)
+        for prefix in prefixes[keyword_lower]:
+            occurrences[prefix].append(position)
+    
+    return occurrences
+
+def _non_overlapping(starts, length, keep=None):
+    """
+    Greedily select non-overlapping occurrences, left to right.
+    
+    Args:
+        starts (list): Ascending start positions
+        length (int): Length of the matched keyword
+        keep (list): Optional flags selecting which starts are candidates
+        
+    Returns:
+        list: Selected start positions
+    """
+    selected = []
+    last_end = 0
+    for i, start in enumerate(starts):
+        if start >= last_end and (keep is None or keep[i]):
+            selected.append(start)
+            last_end = start + length
+    return selected
+
+def _find_keyword_matches(transcript_lower, keywords_lower):
+    """
+    Locate keyword occurrences in a lowercase transcript.
+    
+    Occurrences are classified as exact when both ends fall on a word
+    boundary. Selection follows the same non-overlapping, left-to-right
+    semantics as re.findall and str.count, so results match a per-keyword
+    regex scan.
+    
+    Args:
+        transcript_lower (str): Lowercase transcript text
+        keywords_lower (tuple): Unique lowercase keywords
+        
+    Returns:
+        dict: Mapping of keyword to (exact match start array, total occurrence count)
+    """
+    occurrences = _find_occurrences(transcript_lower, keywords_lower)
+    
+    # A word-character mask pays off once there are enough keywords to reuse it
+    mask = None
+    if len(keywords_lower) >= NUMPY_MIN_KEYWORDS:
+        mask = _word_mask(transcript_lower)
+    
+    matches = {}
+    for keyword_lower, starts in occurrences.items():
+        length = len(keyword_lower)
+        
+        if not starts:
+            is_exact = []
+        elif mask is not None:
+            # Mask index i + 1 holds the character at text index i
+            start_arr = np.array(starts)
+            end_arr = start_arr + length
+            is_exact = (
+                (mask[start_arr] != mask[start_arr + 1])
+                & (mask[end_arr] != mask[end_arr + 1])
+            ).tolist()
+        else:
+            is_exact = [
+                _is_boundary(transcript_lower, start) and _is_boundary(transcript_lower, start + length)
+                for start in starts
+            ]
+        
+        # Exact match starts are kept as a compact integer array
+        exact_starts = array.array('q', _non_overlapping(starts, length, is_exact))
+        total = len(_non_overlapping(starts, length))
+        matches[keyword_lower] = (exact_starts, total)
+    
+    return matches
 
 def count_keywords(transcript, keywords):
     """
@@ -22,7 +326,7 @@ def count_keywords(transcript, keywords):
     timestamp_segments = []
     
     if isinstance(transcript, dict) and 'text' in transcript:
-        has_timestamps = 'segments' in transcript and transcript['segments']
+        has_timestamps = bool('segments' in transcript and transcript['segments'])
         if has_timestamps:
             timestamp_segments = transcript['segments']
             transcript_text = transcript['text']
@@ -34,24 +338,75 @@ def count_keywords(transcript, keywords):
     if not transcript_text or not keywords:
         return {"error": "Empty transcript or no keywords provided"}
     
+    # Reuse the result of an identical earlier analysis
+    cache_key = (_transcript_digest(transcript_text, timestamp_segments), tuple(keywords))
+    if cache_key in _results_cache:
+        _results_cache.move_to_end(cache_key)
+        return copy.deepcopy(_results_cache[cache_key])
+    
+    results = _analyze_keywords(transcript_text, timestamp_segments, has_timestamps, keywords)
+    
+    # Cache a private copy, since callers may add to the returned dict
+    _results_cache[cache_key] = copy.deepcopy(results)
+    if len(_results_cache) > RESULTS_CACHE_SIZE:
+        _results_cache.popitem(last=False)
+    
+    return results
+
+def _transcript_digest(transcript_text, segments):
+    """
+    Compute a digest identifying a transcript and its segment timings.
+    
+    Args:
+        transcript_text (str): Full transcript text
+        segments (list): List of transcript segments with timestamps
+        
+    Returns:
+        bytes: 16-byte BLAKE2b digest
+    """
+    digest = hashlib.blake2b(transcript_text.encode('utf-8'), digest_size=16)
+    for segment in segments:
+        if isinstance(segment, dict):
+            digest.update(repr((segment.get('start'), segment.get('end'), segment.get('text'))).encode('utf-8'))
+    return digest.digest()
+
+def _analyze_keywords(transcript_text, timestamp_segments, has_timestamps, keywords):
+    """
+    Count keyword occurrences and collect their contexts.
+    
+    Args:
+        transcript_text (str): Full transcript text
+        timestamp_segments (list): List of transcript segments with timestamps
+        has_timestamps (bool): Whether timestamp segments are available
+        keywords (list): List of keywords to count
+        
+    Returns:
+        dict: Dictionary with keyword counts and statistics
+    """
     # Convert transcript to lowercase for case-insensitive matching
-    transcript_lower = transcript_text.lower()
+    transcript_lower, total_words = _prepare_transcript(transcript_text)
     
     results = {}
-    total_words = len(transcript_lower.split())
     results["total_words"] = total_words
     results["keywords"] = {}
     
+    # Map segments to transcript offsets once for all timestamp lookups
+    segment_index = build_segment_index(timestamp_segments, transcript_text) if has_timestamps else None
+    
+    # Find all keyword occurrences in one pass over the transcript
+    keywords_lower = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+    keyword_matches = _find_keyword_matches(transcript_lower, keywords_lower)
+    
     # Count occurrences of each keyword
     for keyword in keywords:
         keyword_lower = keyword.lower()
+        exact_starts, occurrences = keyword_matches[keyword_lower]
         
         # Count exact matches (word boundaries)
-        pattern = r'\b' + re.escape(keyword_lower) + r'\b'
-        exact_matches = len(re.findall(pattern, transcript_lower))
+        exact_matches = len(exact_starts)
         
         # Count partial matches (keyword appears within other words)
-        partial_matches = transcript_lower.count(keyword_lower) - exact_matches
+        partial_matches = occurrences - exact_matches
         
         # Calculate frequency percentage (exact matches per 100 words)
         frequency_percentage = (exact_matches / total_words) * 100 if total_words > 0 else 0
@@ -64,32 +419,16 @@ def count_keywords(transcript, keywords):
             "frequency": frequency_percentage
         }
         
-        # Get context for each match (all instances with timestamps)
-        contexts = []
-        if exact_matches > 0:
-            for match in re.finditer(pattern, transcript_lower):
-                # Use more context (100 characters before and after instead of 50)
-                start = max(0, match.start() - 100)
-                end = min(len(transcript_lower), match.end() + 100)
-                context = transcript_text[start:end]
-                
-                # Highlight the keyword in context
-                match_text = transcript_text[match.start():match.end()]
-                highlighted = context.replace(match_text, f"**{match_text}**")
-                
-                # Context data with basic info
-                context_data = {
-                    "text": highlighted,
-                    "position": match.start()
-                }
-                
-                # If we have timestamps, find the relevant segment
-                if has_timestamps:
-                    match_timestamp = find_timestamp_for_position(match.start(), timestamp_segments, transcript_text)
-                    if match_timestamp:
-                        context_data["timestamp"] = match_timestamp
-                
-                contexts.append(context_data)
+        # Get context for each match (all instances with timestamps, unless
+        # MAX_CONTEXTS limits them), building the dicts only at the end
+        if MAX_CONTEXTS is not None:
+            exact_starts = exact_starts[:MAX_CONTEXTS]
+        # Matches are found in the lowercased text, so measure the lowercased keyword
+        length = len(keyword_lower)
+        contexts = [
+            _build_context(transcript_text, match_start, match_start + length, timestamp_segments, segment_index)
+            for match_start in exact_starts
+        ]
         
         results["keywords"][keyword]["contexts"] = contexts
     
@@ -97,10 +436,12 @@ def count_keywords(transcript, keywords):
     total_matches = sum(item["exact_matches"] for item in results["keywords"].values())
     results["total_matches"] = total_matches
     
-    # Sort keywords by number of matches (descending)
-    results["sorted_keywords"] = sorted(
-        results["keywords"].items(),
-        key=lambda x: x[1]["exact_matches"],
+    # Order keyword names by number of matches (descending); the data itself
+    # stays in results["keywords"]
+    keyword_data = results["keywords"]
+    results["keyword_order"] = sorted(
+        keyword_data,
+        key=lambda keyword: keyword_data[keyword]["exact_matches"],
         reverse=True
     )
     
@@ -109,48 +450,135 @@ def count_keywords(transcript, keywords):
     
     return results
 
-def find_timestamp_for_position(position, segments, transcript_text):
+def _build_context(transcript_text, match_start, match_end, segments, segment_index):
     """
-    Find the timestamp information for a specific position in the transcript.
+    Build the context entry for a single keyword match.
+    
+    Args:
+        transcript_text (str): Full transcript text
+        match_start (int): Start offset of the match
+        match_end (int): End offset of the match
+        segments (list): List of transcript segments with timestamps
+        segment_index (dict): Result of build_segment_index, or None without timestamps
+        
+    Returns:
+        dict: Highlighted context text, position and timestamp if available
+    """
+    # Use more context (100 characters before and after instead of 50)
+    start = max(0, match_start - 100)
+    end = min(len(transcript_text), match_end + 100)
+    context = transcript_text[start:end]
+    
+    # Highlight this match in context by slicing at its known offsets
+    rel_start = match_start - start
+    rel_end = match_end - start
+    highlighted = f"{context[:rel_start]}**{context[rel_start:rel_end]}**{context[rel_end:]}"
+    
+    # Context data with basic info
+    context_data = {
+        "text": highlighted,
+        "position": match_start
+    }
+    
+    # If we have timestamps, find the relevant segment
+    if segment_index is not None:
+        match_timestamp = find_timestamp_for_position(match_start, segments, transcript_text, segment_index)
+        if match_timestamp:
+            context_data["timestamp"] = match_timestamp
+    
+    return context_data
+
+def build_segment_index(segments, transcript_text):
+    """
+    Locate each timestamped segment in the transcript text.
+    
+    Segments are searched for in order, each one starting where the previous
+    match ended, so the resulting offsets are ascending. The middle time point
+    of every timed segment is also stored for closest-segment estimates, as a
+    NumPy array when numpy is installed.
     
     Args:
-        position (int): Character position in the transcript
         segments (list): List of transcript segments with timestamps
         transcript_text (str): Full transcript text
         
     Returns:
-        dict: Dictionary with start and end timestamps, or None if not found
+        dict: Parallel sequences of text offsets, segments and time midpoints
     """
-    if not segments:
-        return None
+    index = {"starts": [], "ends": [], "segments": [], "timed_segments": [], "mids": []}
+    search_from = 0
     
-    # First, try to find a direct match in any segment
-    for segment in segments:
+    for segment in segments or []:
         if not isinstance(segment, dict):
             # Skip non-dictionary segments
             continue
-            
+        
+        if 'start' not in segment or 'end' not in segment:
+            continue
+        
+        # Calculate middle time point of this segment
+        index["timed_segments"].append(segment)
+        index["mids"].append((segment.get('start', 0) + segment.get('end', 0)) / 2)
+        
         # Check if segment has the necessary attributes
-        if 'text' not in segment or 'start' not in segment or 'end' not in segment:
+        if 'text' not in segment:
             continue
-            
+        
         segment_text = segment.get('text', '')
         
         # Skip empty segments
         if not segment_text:
             continue
-            
-        # Try to find this segment in the transcript
-        segment_pos = transcript_text.find(segment_text)
-        if segment_pos != -1:
-            # Check if our position is within this segment
-            if position >= segment_pos and position <= segment_pos + len(segment_text):
-                return {
-                    "start": format_timestamp(segment.get('start', 0)),
-                    "end": format_timestamp(segment.get('end', 0)),
-                    "text": segment_text,
-                    "exact_match": True
-                }
+        
+        segment_pos = transcript_text.find(segment_text, search_from)
+        if segment_pos == -1:
+            continue
+        
+        index["starts"].append(segment_pos)
+        index["ends"].append(segment_pos + len(segment_text))
+        index["segments"].append(segment)
+        search_from = segment_pos + len(segment_text)
+    
+    if numpy_available:
+        index["mids"] = np.array(index["mids"], dtype=np.float64)
+    
+    return index
+
+def find_timestamp_for_position(position, segments, transcript_text, segment_index=None):
+    """
+    Find the timestamp information for a specific position in the transcript.
+    
+    Args:
+        position (int): Character position in the transcript
+        segments (list): List of transcript segments with timestamps
+        transcript_text (str): Full transcript text
+        segment_index (dict): Optional result of build_segment_index to reuse
+        
+    Returns:
+        dict: Dictionary with start and end timestamps, or None if not found
+    """
+    if not segments:
+        return None
+    
+    if segment_index is None:
+        segment_index = build_segment_index(segments, transcript_text)
+    
+    # First, try to find the segment containing the position directly
+    starts = segment_index["starts"]
+    ends = segment_index["ends"]
+    i = bisect.bisect_right(starts, position) - 1
+    
+    # A position on the boundary of two segments belongs to the earlier one
+    if i > 0 and ends[i - 1] >= position:
+        i -= 1
+    
+    if i >= 0 and position <= ends[i]:
+        segment = segment_index["segments"][i]
+        return {
+            "start": format_timestamp(segment.get('start', 0)),
+            "end": format_timestamp(segment.get('end', 0)),
+            "text": segment.get('text', ''),
+            "exact_match": True
+        }
     
     # If no direct match, look for overlapping segments
     for segment in segments:
@@ -193,24 +621,14 @@ def find_timestamp_for_position(position, segments, transcript_text):
             
             # Find segment closest to this estimated time
             closest_segment = None
-            min_distance = float('inf')
+            mids = segment_index["mids"]
             
-            for segment in segments:
-                if not isinstance(segment, dict):
-                    continue
-                    
-                if 'start' not in segment or 'end' not in segment:
-                    continue
-                    
-                # Calculate middle time point of this segment
-                segment_mid = (segment.get('start', 0) + segment.get('end', 0)) / 2
-                
-                # Calculate distance to our estimated time
-                distance = abs(estimated_time - segment_mid)
-                
-                if distance < min_distance:
-                    min_distance = distance
-                    closest_segment = segment
+            if len(mids):
+                if numpy_available:
+                    closest = int(np.abs(mids - estimated_time).argmin())
+                else:
+                    closest = min(range(len(mids)), key=lambda i: abs(estimated_time - mids[i]))
+                closest_segment = segment_index["timed_segments"][closest]
             
             if closest_segment:
                 return {
@@ -253,12 +671,20 @@ def similarity(text1, text2):
     shorter = text1 if len(text1) <= len(text2) else text2
     longer = text2 if len(text1) <= len(text2) else text1
     
-    # Count matching characters
-    matches = sum(1 for c in shorter if c in longer)
+    # Count matching characters, using a set for constant-time membership
+    longer_chars = set(longer)
+    matches = sum(1 for c in shorter if c in longer_chars)
     
     # Return similarity score
     return matches / len(shorter)
 
+@functools.lru_cache(maxsize=8192)
+def _format_whole_seconds(seconds):
+    """Format a non-negative whole number of seconds as HH:MM:SS."""
+    hours, remainder = divmod(seconds, 3600)
+    minutes, secs = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{secs:02d}"
+
 def format_timestamp(seconds):
     """
     Format seconds as HH:MM:SS.
@@ -271,12 +697,79 @@ def format_timestamp(seconds):
     """
     if not isinstance(seconds, (int, float)):
         return "00:00:00"
+    
+    # Non-negative times only depend on the whole seconds, so reuse results
+    if seconds >= 0:
+        return _format_whole_seconds(int(seconds))
         
     hours = int(seconds / 3600)
     minutes = int((seconds % 3600) / 60)
     secs = int(seconds % 60)
     return f"{hours:02d}:{minutes:02d}:{secs:02d}"
 
+def _build_vocab_index(words):
+    """
+    Index a vocabulary for fast substring lookups.
+    
+    The words are joined into a single NUL-separated string so that one
+    str.find scan can locate a keyword inside any of them.
+    
+    Args:
+        words (list): Words in rank order
+        
+    Returns:
+        dict: Words, their joined blob, blob start offsets and rank by word
+    """
+    starts = []
+    offset = 0
+    for word in words:
+        starts.append(offset)
+        offset += len(word) + 1
+    
+    return {
+        "words": words,
+        "blob": "\x00".join(words),
+        "starts": starts,
+        "rank": {word: i for i, word in enumerate(words)}
+    }
+
+def _substring_related(keyword_lower, vocab_index):
+    """
+    Find vocabulary words that contain the keyword or are contained by it.
+    
+    Args:
+        keyword_lower (str): Lowercase keyword
+        vocab_index (dict): Result of _build_vocab_index
+        
+    Returns:
+        list: Ascending ranks of the matching words
+    """
+    blob = vocab_index["blob"]
+    starts = vocab_index["starts"]
+    rank = vocab_index["rank"]
+    hits = set()
+    
+    if not keyword_lower:
+        return []
+    
+    # Words containing the keyword, resuming the search at the next word
+    position = blob.find(keyword_lower)
+    while position != -1:
+        i = bisect.bisect_right(starts, position) - 1
+        hits.add(i)
+        if i + 1 >= len(starts):
+            break
+        position = blob.find(keyword_lower, starts[i + 1])
+    
+    # Words contained in the keyword (vocabulary words have 3+ letters)
+    for i in range(len(keyword_lower)):
+        for j in range(i + 3, len(keyword_lower) + 1):
+            word_rank = rank.get(keyword_lower[i:j])
+            if word_rank is not None:
+                hits.add(word_rank)
+    
+    return sorted(hits)
+
 def find_related_terms(transcript, keywords, threshold=0.7):
     """
     Find terms in the transcript that might be related to the provided keywords.
@@ -298,16 +791,26 @@ def find_related_terms(transcript, keywords, threshold=0.7):
     if not transcript_text or not keywords:
         return {}
     
-    # Extract all words from transcript
-    words = re.findall(r'\b[a-z]{3,}\b', transcript_text.lower())
+    # Lowercase the transcript once and reuse it for every keyword
+    transcript_lower, _ = _prepare_transcript(transcript_text)
+    tlen = len(transcript_lower)
+    
+    # Tokenize once, keeping word offsets for the context window sweep
+    words, word_starts, word_ends = _tokenize_words(transcript_lower)
     
     # Filter out common stop words
-    stop_words = {'the', 'and', 'that', 'for', 'you', 'this', 'with', 'have', 'from', 'are', 'was', 'were'}
-    filtered_words = [word for word in words if word not in stop_words]
+    filtered_words = [word for word in words if word not in STOP_WORDS]
     
     # Count word frequencies
     word_counts = Counter(filtered_words)
     
+    # Find whole-word keyword occurrences in one pass over the transcript
+    keywords_lower = tuple(dict.fromkeys(keyword.lower() for keyword in keywords))
+    keyword_matches = _find_keyword_matches(transcript_lower, keywords_lower)
+    
+    # Index the most common words once for substring lookups
+    vocab_index = _build_vocab_index([word for word, _ in word_counts.most_common(100)])
+    
     # Find related terms for each keyword
     related_terms = {}
     
@@ -316,31 +819,29 @@ def find_related_terms(transcript, keywords, threshold=0.7):
         related = {}
         
         # First, find terms that contain the keyword or are contained by it
-        for word, count in word_counts.most_common(100):
+        for i in _substring_related(keyword_lower, vocab_index):
+            word = vocab_index["words"][i]
+            
             # Skip exact matches
             if word == keyword_lower:
                 continue
-                
-            # Check if the word contains the keyword or vice versa
-            if keyword_lower in word or word in keyword_lower:
-                related[word] = count
+            
+            related[word] = word_counts[word]
         
         # Look for words that frequently appear near the keyword
-        keyword_pattern = re.compile(r'\b' + re.escape(keyword_lower) + r'\b')
-        keyword_matches = list(keyword_pattern.finditer(transcript_text.lower()))
-        
-        if keyword_matches:
-            # Extract context around each keyword occurrence
-            for match in keyword_matches:
-                start_pos = max(0, match.start() - 150)
-                end_pos = min(len(transcript_text), match.end() + 150)
-                context = transcript_text[start_pos:end_pos].lower()
-                
-                # Find words in this context
-                context_words = re.findall(r'\b[a-z]{3,}\b', context)
-                for word in context_words:
-                    if word != keyword_lower and word not in stop_words:
-                        related[word] = related.get(word, 0) + 1
+        exact_starts, _ = keyword_matches[keyword_lower]
+        
+        # Extract context around each keyword occurrence
+        for match_start in exact_starts:
+            start_pos = max(0, match_start - 150)
+            end_pos = min(tlen, match_start + len(keyword_lower) + 150)
+            
+            # Find words that lie entirely within this context
+            first = bisect.bisect_left(word_starts, start_pos)
+            last = bisect.bisect_right(word_ends, end_pos)
+            for word in words[first:last]:
+                if word != keyword_lower and word not in STOP_WORDS:
+                    related[word] = related.get(word, 0) + 1
         
         # Sort related terms by count and take the top 10
         related_terms[keyword] = dict(sorted(related.items(), key=lambda x: x[1], reverse=True)[:10])
@@ -0,0 +1,293 @@
+"""
+Module for caching transcripts and analysis results on disk between runs.
+"""
+
+import os
+import re
+import json
+import time
+import shutil
+import hashlib
+from pathlib import Path
+from .fileio import atomic_open
+
+# Default cache location (override with YTWA_CACHE_DIR)
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parent.parent / '.cache' / 'ytwa'
+
+# Cached entries older than this are ignored (in seconds, 7 days)
+CACHE_EXPIRY = 7 * 24 * 60 * 60
+
+# Bump when the analyzer's output changes so stale cached results are ignored
+ANALYSIS_CACHE_VERSION = 1
+
+# Least recently used entries are removed once the cache grows past this (2GB)
+MAX_CACHE_SIZE = 2 * 1024 * 1024 * 1024
+
+# Characters allowed in cache file names
+_UNSAFE_CHARS_RE = re.compile(r'[^A-Za-z0-9_.-]')
+
+# Bytes read at a time when hashing audio files
+HASH_BLOCK_SIZE = 1024 * 1024
+
+def get_cache_dir():
+    """
+    Get the directory used for cached data.
+    
+    Returns:
+        Path: Cache directory (may not exist yet)
+    """
+    return Path(os.environ.get("YTWA_CACHE_DIR", DEFAULT_CACHE_DIR))
+
+def _transcript_cache_path(video_id, model):
+    """
+    Get the cache file path for a video transcript.
+    
+    Args:
+        video_id (str): YouTube video ID
+        model (str): Whisper model used for the transcript
+        
+    Returns:
+        Path: Path to the cache file
+    """
+    name = _UNSAFE_CHARS_RE.sub('_', f"{video_id}_{model}")
+    return get_cache_dir() / 'transcripts' / f"{name}.json"
+
+def _read_entry(cache_path):
+    """
+    Read a cache entry, marking it as recently used.
+    
+    Args:
+        cache_path (Path): Path to the cache file
+        
+    Returns:
+        dict: Cache entry, or None if missing, expired or unreadable
+    """
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            entry = json.load(f)
+        if time.time() - entry.get('created', 0) > CACHE_EXPIRY:
+            return None
+        # Mark the entry as recently used for eviction
+        os.utime(cache_path)
+        return entry
+    except (OSError, ValueError, AttributeError, TypeError):
+        return None
+
+def _write_entry(cache_path, entry):
+    """
+    Write a cache entry atomically and evict old entries if the cache is too large.
+    
+    Args:
+        cache_path (Path): Path to the cache file
+        entry (dict): JSON-serializable cache entry
+    """
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    # Written atomically so readers never see a partial entry
+    with atomic_open(cache_path, 'w', encoding='utf-8') as f:
+        json.dump(entry, f, default=str)
+    
+    _evict_entries(MAX_CACHE_SIZE)
+
+def load_cached_transcript(video_id, model):
+    """
+    Load a cached transcript for a video and model.
+    
+    Args:
+        video_id (str): YouTube video ID
+        model (str): Whisper model used for the transcript
+        
+    Returns:
+        str or dict: Cached transcript, or None if missing, expired or unreadable
+    """
+    entry = _read_entry(_transcript_cache_path(video_id, model))
+    return entry.get('transcript') if entry else None
+
+def save_cached_transcript(video_id, model, transcript):
+    """
+    Save a transcript to the cache with metadata about how it was created.
+    
+    Args:
+        video_id (str): YouTube video ID
+        model (str): Whisper model used for the transcript
+        transcript (str or dict): Transcript text or dictionary with text and timestamps
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    entry = {
+        'video_id': video_id,
+        'model': model,
+        'created': time.time(),
+        'transcript': transcript
+    }
+    try:
+        _write_entry(_transcript_cache_path(video_id, model), entry)
+        return True
+    except (OSError, TypeError) as e:
+        print(f"Warning: Failed to cache transcript: {e}")
+        return False
+
+def hash_audio_file(audio_file):
+    """
+    Get the SHA-256 digest of an audio file's contents.
+    
+    Args:
+        audio_file (str): Path to the audio file
+        
+    Returns:
+        str: Hex digest of the file contents
+    """
+    digest = hashlib.sha256()
+    with open(audio_file, 'rb') as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def _chunk_cache_path(audio_digest, model):
+    """
+    Get the cache file path for the transcription of an audio chunk.
+    
+    Args:
+        audio_digest (str): SHA-256 digest of the chunk contents
+        model (str): Whisper model used for the transcription
+        
+    Returns:
+        Path: Path to the cache file
+    """
+    name = _UNSAFE_CHARS_RE.sub('_', f"{audio_digest}_{model}")
+    return get_cache_dir() / 'chunks' / f"{name}.json"
+
+def load_cached_chunk(audio_digest, model):
+    """
+    Load a cached transcription of an audio chunk.
+    
+    Args:
+        audio_digest (str): SHA-256 digest of the chunk contents
+        model (str): Whisper model used for the transcription
+        
+    Returns:
+        str or dict: Cached transcription, or None if missing, expired or unreadable
+    """
+    entry = _read_entry(_chunk_cache_path(audio_digest, model))
+    return entry.get('transcript') if entry else None
+
+def save_cached_chunk(audio_digest, model, transcript):
+    """
+    Save the transcription of an audio chunk to the cache.
+    
+    Args:
+        audio_digest (str): SHA-256 digest of the chunk contents
+        model (str): Whisper model used for the transcription
+        transcript (str or dict): Transcript text or dictionary with text and timestamps
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    entry = {
+        'model': model,
+        'created': time.time(),
+        'transcript': transcript
+    }
+    try:
+        _write_entry(_chunk_cache_path(audio_digest, model), entry)
+        return True
+    except (OSError, TypeError) as e:
+        print(f"Warning: Failed to cache chunk transcription: {e}")
+        return False
+
+def _analysis_cache_path(transcript, keywords):
+    """
+    Get the cache file path for the analysis of a transcript.
+    
+    Args:
+        transcript (str or dict): Transcript text or dictionary with text and timestamps
+        keywords (list): Keywords analyzed, in order
+        
+    Returns:
+        Path: Path to the cache file
+    """
+    key_data = json.dumps([ANALYSIS_CACHE_VERSION, transcript, keywords], default=str)
+    digest = hashlib.sha1(key_data.encode('utf-8')).hexdigest()
+    return get_cache_dir() / 'analysis' / f"{digest}.json"
+
+def load_cached_analysis(transcript, keywords):
+    """
+    Load cached analysis results for a transcript and keyword list.
+    
+    Args:
+        transcript (str or dict): Transcript text or dictionary with text and timestamps
+        keywords (list): Keywords analyzed, in order
+        
+    Returns:
+        dict: Cached analysis results, or None if missing, expired or unreadable
+    """
+    entry = _read_entry(_analysis_cache_path(transcript, keywords))
+    return entry.get('results') if entry else None
+
+def save_cached_analysis(transcript, keywords, results):
+    """
+    Save analysis results for a transcript and keyword list to the cache.
+    
+    Args:
+        transcript (str or dict): Transcript text or dictionary with text and timestamps
+        keywords (list): Keywords analyzed, in order
+        results (dict): Analysis results, including related terms
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    entry = {
+        'keywords': keywords,
+        'created': time.time(),
+        'results': results
+    }
+    try:
+        _write_entry(_analysis_cache_path(transcript, keywords), entry)
+        return True
+    except (OSError, TypeError) as e:
+        print(f"Warning: Failed to cache analysis results: {e}")
+        return False
+
+def _evict_entries(max_size):
+    """
+    Remove the least recently used cache entries until the total size fits.
+    
+    Args:
+        max_size (int): Maximum total size of the cache entries in bytes
+    """
+    entries = []
+    total_size = 0
+    for path in get_cache_dir().glob('*/*.json'):
+        try:
+            stat = path.stat()
+        except OSError:
+            continue
+        entries.append((stat.st_mtime, stat.st_size, path))
+        total_size += stat.st_size
+    
+    entries.sort()
+    for _, size, path in entries:
+        if total_size <= max_size:
+            break
+        try:
+            path.unlink()
+            total_size -= size
+        except OSError:
+            pass
+
+def clear_cache():
+    """
+    Remove all cached data.
+    
+    Returns:
+        bool: True if the cache was removed or did not exist, False otherwise
+    """
+    cache_dir = get_cache_dir()
+    if not cache_dir.exists():
+        return True
+    try:
+        shutil.rmtree(cache_dir)
+        return True
+    except OSError as e:
+        print(f"Error clearing cache: {e}")
+        return False
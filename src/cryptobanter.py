@@ -18,11 +18,11 @@ crypto_banter = [
     RED + "▀▀▀ ▀ ▀  ▀  ▀    ▀  ▀▀▀" + WHITE + "   ▀▀  ▀ ▀ ▀  ▀  ▀  ▀▀▀ ▀ ▀" + RESET
 ]
 
+# Complete banner, composed once and written in a single call
+_BANNER = "\n\n" + "".join("  " + line + "\n" for line in crypto_banter) + "\n\n"
+
 def print_crypto_banter():
-    print("\n")
-    for line in crypto_banter:
-        print("  " + line)
-    print("\n")
+    sys.stdout.write(_BANNER)
 
 if __name__ == "__main__":
     print_crypto_banter() 
\ No newline at end of file
@@ -4,16 +4,30 @@ Module for downloading audio from YouTube videos.
 
 import os
 import re
+import glob
 import time
+import queue
 import random
+import threading
 import subprocess
 import shutil
+from functools import lru_cache
 from urllib.parse import urlparse, parse_qs
 
 # Maximum number of retries for downloading
 MAX_RETRIES = 3
-# Delay between retries (in seconds)
-RETRY_DELAY = [1, 3, 5]  # Progressive backoff
+# Base and maximum delay between retries (in seconds)
+RETRY_BASE_DELAY = 1
+RETRY_MAX_DELAY = 30
+
+# Number of videos downloaded at the same time in batch mode
+DEFAULT_DOWNLOAD_CONCURRENCY = 4
+
+# Finished downloads allowed to wait for the consumer in iter_download_audio
+DEFAULT_MAX_PENDING_DOWNLOADS = 2
+
+# Bare YouTube video IDs are 11 URL-safe characters
+_VIDEO_ID_RE = re.compile(r'^[a-zA-Z0-9_-]{11}$')
 
 def extract_video_id(url):
     """
@@ -29,7 +43,7 @@ def extract_video_id(url):
         return None
     
     # Check if the input is already a video ID (no slashes or special chars)
-    if re.match(r'^[a-zA-Z0-9_-]{11}$', url):
+    if _VIDEO_ID_RE.match(url):
         return url
     
     # Handle youtube.com URLs
@@ -42,7 +56,7 @@ def extract_video_id(url):
         
         # Handle live URLs (format: youtube.com/live/VIDEO_ID)
         path_parts = parsed_url.path.strip('/').split('/')
-        if len(path_parts) >= 2 and path_parts[0] == 'live' and re.match(r'^[a-zA-Z0-9_-]{11}$', path_parts[1]):
+        if len(path_parts) >= 2 and path_parts[0] == 'live' and _VIDEO_ID_RE.match(path_parts[1]):
             return path_parts[1]
     
     # Handle youtu.be URLs
@@ -51,10 +65,13 @@ def extract_video_id(url):
     
     return None
 
+@lru_cache(maxsize=1)
 def find_ffmpeg():
     """
     Find ffmpeg executable in the system or in the project directory.
     
+    The result is cached, so the search runs once per process.
+    
     Returns:
         str: Path to ffmpeg executable or None if not found
     """
@@ -77,6 +94,24 @@ def find_ffmpeg():
     
     return None
 
+def find_downloaded_file(output_file):
+    """
+    Find an mp3 file whose name starts with the given output filename.
+    
+    Args:
+        output_file (str): Output filename passed to yt-dlp (without extension)
+        
+    Returns:
+        str: Path to the downloaded file or None if not found
+    """
+    matches = glob.glob(f"{glob.escape(output_file)}*.mp3")
+    if matches:
+        print(f"Found downloaded file: {matches[0]}")
+        return matches[0]
+    
+    print(f"Could not find downloaded file with base name: {os.path.basename(output_file)}")
+    return None
+
 def download_with_yt_dlp(url, output_filename):
     """
     Download audio from YouTube using yt-dlp.
@@ -129,17 +164,7 @@ def download_with_yt_dlp(url, output_filename):
                 print(f"Successfully downloaded with yt-dlp module to: {expected_output}")
                 return expected_output
             else:
-                # Try to find any file that starts with the output filename
-                dir_path = os.path.dirname(output_file) or '.'
-                base_name = os.path.basename(output_file)
-                for file in os.listdir(dir_path):
-                    if file.startswith(base_name) and file.endswith('.mp3'):
-                        full_path = os.path.join(dir_path, file)
-                        print(f"Found downloaded file: {full_path}")
-                        return full_path
-                
-                print(f"Could not find downloaded file with base name: {base_name}")
-                return None
+                return find_downloaded_file(output_file)
                 
         except ImportError:
             print("yt-dlp Python module not available, trying command line...")
@@ -164,40 +189,51 @@ def download_with_yt_dlp(url, output_filename):
                 cmd.extend(["--ffmpeg-location", os.path.dirname(ffmpeg_path)])
             
             print("Attempting download with yt-dlp command...")
-            result = subprocess.run(cmd, capture_output=True, text=True)
             
-            if result.returncode == 0:
+            # Stream yt-dlp output as it arrives instead of buffering it until exit
+            with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True, bufsize=1) as proc:
+                for line in proc.stdout:
+                    print(line, end='')
+            
+            if proc.returncode == 0:
                 expected_output = f"{output_file}.mp3"
                 if os.path.exists(expected_output):
                     print(f"Successfully downloaded with yt-dlp command to: {expected_output}")
                     return expected_output
                 else:
-                    # Try to find any file that starts with the output filename
-                    dir_path = os.path.dirname(output_file) or '.'
-                    base_name = os.path.basename(output_file)
-                    for file in os.listdir(dir_path):
-                        if file.startswith(base_name) and file.endswith('.mp3'):
-                            full_path = os.path.join(dir_path, file)
-                            print(f"Found downloaded file: {full_path}")
-                            return full_path
-                    
-                    print(f"Could not find downloaded file with base name: {base_name}")
-                    return None
+                    return find_downloaded_file(output_file)
             else:
-                print(f"yt-dlp command failed: {result.stderr}")
+                print(f"yt-dlp command failed with exit code {proc.returncode}")
                 return None
                 
     except Exception as e:
         print(f"Error with yt-dlp: {e}")
         return None
 
-def download_audio(video_id_or_url, output_filename="downloaded_audio"):
+def retry_delay(attempt, rng=random):
+    """
+    Get the delay before the next download retry.
+    
+    Uses exponential backoff with full jitter, so concurrent batch downloads
+    don't retry in lockstep.
+    
+    Args:
+        attempt (int): Number of the attempt that just failed (starting at 0)
+        rng (random.Random): Random number generator to draw the delay from
+        
+    Returns:
+        float: Delay in seconds
+    """
+    return rng.uniform(0, min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** attempt))
+
+def download_audio(video_id_or_url, output_filename="downloaded_audio", rng=random):
     """
     Download audio from a YouTube video.
     
     Args:
         video_id_or_url (str): YouTube video ID or URL
         output_filename (str): Name for the output file (without extension)
+        rng (random.Random): Random number generator for retry delays
         
     Returns:
         str: Path to the downloaded audio file or None if download failed
@@ -213,10 +249,57 @@ def download_audio(video_id_or_url, output_filename="downloaded_audio"):
     print(f"Downloading audio from: {url}")
     
     # Try yt-dlp as the primary method
-    print("Downloading with yt-dlp...")
-    yt_dlp_result = download_with_yt_dlp(url, output_filename)
-    if yt_dlp_result:
-        return yt_dlp_result
+    for attempt in range(MAX_RETRIES):
+        print("Downloading with yt-dlp...")
+        yt_dlp_result = download_with_yt_dlp(url, output_filename)
+        if yt_dlp_result:
+            return yt_dlp_result
+        
+        if attempt < MAX_RETRIES - 1:
+            delay = retry_delay(attempt, rng)
+            print(f"Download failed, retrying in {delay:.1f} seconds (attempt {attempt + 2}/{MAX_RETRIES})...")
+            time.sleep(delay)
     
     print("Failed to download audio from YouTube.")
-    return None 
\ No newline at end of file
+    return None
+
+def iter_download_audio(video_ids, concurrency=DEFAULT_DOWNLOAD_CONCURRENCY, max_pending=DEFAULT_MAX_PENDING_DOWNLOADS, output_dir=None):
+    """
+    Download audio for several YouTube videos in background threads, yielding
+    each one as soon as it finishes so the caller can transcribe it while the
+    rest are still downloading.
+    
+    Downloads start immediately. Workers pause once max_pending finished
+    downloads are waiting to be consumed, which bounds the audio kept on disk.
+    
+    Args:
+        video_ids (list): YouTube video IDs
+        concurrency (int): Maximum number of downloads running at once
+        max_pending (int): Maximum number of finished downloads waiting to be consumed
+        output_dir (str): Directory to save the audio in (default: current directory)
+        
+    Returns:
+        iterator: (video_id, audio path or None if the download failed) in completion order
+    """
+    work = queue.Queue()
+    for video_id in video_ids:
+        work.put(video_id)
+    finished = queue.Queue(maxsize=max(1, max_pending))
+    
+    def worker():
+        while True:
+            try:
+                video_id = work.get_nowait()
+            except queue.Empty:
+                return
+            output_filename = os.path.join(output_dir or '', f"yt_{video_id}")
+            finished.put((video_id, download_audio(video_id, output_filename)))
+    
+    for _ in range(min(max(1, concurrency), len(video_ids))):
+        threading.Thread(target=worker, daemon=True).start()
+    
+    def drain():
+        for _ in range(len(video_ids)):
+            yield finished.get()
+    
+    return drain()
@@ -0,0 +1,50 @@
+"""
+Module for writing output files safely.
+"""
+
+import os
+import uuid
+from contextlib import contextmanager
+
+# Flags for creating the temporary file; O_EXCL makes the name ours alone
+# and O_BINARY (Windows only) stops the C runtime translating newlines
+_TEMP_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_EXCL | getattr(os, 'O_BINARY', 0)
+
+@contextmanager
+def atomic_open(path, mode='w', encoding=None):
+    """
+    Open a file for writing so it only appears at its final path once complete.
+    
+    Data is written to a temporary file in the same directory, flushed to disk
+    and then moved over the target, so an interrupted run never leaves a
+    truncated transcript or result behind for a later run to pick up.
+    
+    Args:
+        path (str or Path): Final path of the file
+        mode (str): 'w' for text or 'wb' for binary
+        encoding (str): Text encoding (text mode only)
+        
+    Yields:
+        file: File object to write to
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    # Created with mode 0666 so the kernel applies the process umask, as open() would
+    while True:
+        temp_path = os.path.join(directory, f".{os.path.basename(path)}.{uuid.uuid4().hex}.tmp")
+        try:
+            fd = os.open(temp_path, _TEMP_FLAGS, 0o666)
+            break
+        except FileExistsError:
+            continue
+    try:
+        with os.fdopen(fd, mode, encoding=encoding) as f:
+            yield f
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except BaseException:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
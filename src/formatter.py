@@ -2,8 +2,20 @@
 Module for formatting analysis results.
 """
 
+import os
+import re
+import mmap
 import json
 import sys
+from functools import lru_cache
+from .fileio import atomic_open
+
+# Try to load orjson for faster JSON output
+try:
+    import orjson
+    orjson_available = True
+except ImportError:
+    orjson_available = False
 
 # ANSI color codes
 RED = "\033[31m"
@@ -16,6 +28,18 @@ WHITE = "\033[37m"
 BOLD = "\033[1m"
 RESET = "\033[0m"
 
+# Color names accepted by create_box
+_COLORS = {
+    "RED": RED, "GREEN": GREEN, "YELLOW": YELLOW, "BLUE": BLUE, "MAGENTA": MAGENTA,
+    "CYAN": CYAN, "WHITE": WHITE, "BOLD": BOLD, "RESET": RESET
+}
+
+# ANSI escape sequences, stripped for width calculations
+_ANSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+
+# Case-insensitive highlight patterns, keyed by lowercase keyword
+_HIGHLIGHT_CACHE = {}
+
 # 8-bit style pixel art for "cryptobanter"
 CRYPTO_BANTER = [
     RED + "█▀▀ █▀█ █▄█ █▀█ ▀█▀ █▀█" + WHITE + "   █▀▄ █▀█ █▄ █ ▀█▀ █▀▀ █▀█" + RESET,
@@ -31,38 +55,45 @@ def format_crypto_banter():
     lines.append("\n")
     return "\n".join(lines)
 
+# Box drawing characters for each create_box style
+_BOX_STYLES = {
+    "single": {
+        "top_left": "┌", "top_right": "┐", "bottom_left": "└", "bottom_right": "┘",
+        "horizontal": "─", "vertical": "│", "title_left": "─ ", "title_right": " ─"
+    },
+    "double": {
+        "top_left": "╔", "top_right": "╗", "bottom_left": "╚", "bottom_right": "╝",
+        "horizontal": "═", "vertical": "║", "title_left": "═ ", "title_right": " ═"
+    },
+    "rounded": {
+        "top_left": "╭", "top_right": "╮", "bottom_left": "╰", "bottom_right": "╯",
+        "horizontal": "─", "vertical": "│", "title_left": "─ ", "title_right": " ─"
+    }
+}
+
+@lru_cache(maxsize=256)
+def _rule(char, length):
+    """Return char repeated length times (boxes mostly share widths and paddings)"""
+    return char * length
+
 def create_box(content, width=70, title=None, style="single", color=None):
     """
     Create a box around text with optional title
     """
-    box = {
-        "single": {
-            "top_left": "┌", "top_right": "┐", "bottom_left": "└", "bottom_right": "┘",
-            "horizontal": "─", "vertical": "│", "title_left": "─ ", "title_right": " ─"
-        },
-        "double": {
-            "top_left": "╔", "top_right": "╗", "bottom_left": "╚", "bottom_right": "╝",
-            "horizontal": "═", "vertical": "║", "title_left": "═ ", "title_right": " ═"
-        },
-        "rounded": {
-            "top_left": "╭", "top_right": "╮", "bottom_left": "╰", "bottom_right": "╯",
-            "horizontal": "─", "vertical": "│", "title_left": "─ ", "title_right": " ─"
-        }
-    }[style]
+    box = _BOX_STYLES[style]
+    rule = _rule(box['horizontal'], width)
     
     # Apply color if specified
-    color_code = ""
-    if color:
-        color_code = eval(color.upper()) if color.upper() in globals() else ""
+    color_code = _COLORS.get(color.upper(), "") if color else ""
     
     # Create box top
     result = []
     if title:
         title_text = f"{box['title_left']}{title}{box['title_right']}"
         padding = width - len(title) - len(box['title_left']) - len(box['title_right'])
-        result.append(f"{color_code}{box['top_left']}{title_text}{box['horizontal'] * padding}{box['top_right']}{RESET}")
+        result.append(f"{color_code}{box['top_left']}{title_text}{_rule(box['horizontal'], padding)}{box['top_right']}{RESET}")
     else:
-        result.append(f"{color_code}{box['top_left']}{box['horizontal'] * width}{box['top_right']}{RESET}")
+        result.append(f"{color_code}{box['top_left']}{rule}{box['top_right']}{RESET}")
     
     # Add content
     if isinstance(content, str):
@@ -76,74 +107,82 @@ def create_box(content, width=70, title=None, style="single", color=None):
         
         # Ensure line fits in box width
         if len(stripped_line) > width - 2:
-            # Wrap text
+            # Wrap text, tracking visible lengths so each word is stripped once
             wrapped_lines = []
-            current_line = ""
+            current_parts = []
+            current_len = 0
             words = line.split()
             
             for word in words:
-                stripped_word = strip_ansi_codes(word)
-                if len(strip_ansi_codes(current_line) + stripped_word) + 1 <= width - 2:
-                    if current_line:
-                        current_line += " " + word
-                    else:
-                        current_line = word
+                word_len = len(strip_ansi_codes(word))
+                if current_len + word_len + 1 <= width - 2:
+                    if current_parts:
+                        current_len += 1
+                    current_parts.append(word)
+                    current_len += word_len
                 else:
-                    if current_line:
-                        wrapped_lines.append(current_line)
-                    current_line = word
+                    if current_parts:
+                        wrapped_lines.append((" ".join(current_parts), current_len))
+                    current_parts = [word]
+                    current_len = word_len
                     
-            if current_line:
-                wrapped_lines.append(current_line)
+            if current_parts:
+                wrapped_lines.append((" ".join(current_parts), current_len))
                 
             if not wrapped_lines:
                 # If we couldn't wrap properly, just truncate
-                wrapped_lines = [line[:width-2]]
+                truncated = line[:width-2]
+                wrapped_lines = [(truncated, len(strip_ansi_codes(truncated)))]
                 
-            for wrapped in wrapped_lines:
-                stripped_wrapped = strip_ansi_codes(wrapped)
-                padding = width - 2 - len(stripped_wrapped)
-                result.append(f"{color_code}{box['vertical']} {wrapped}{' ' * padding} {box['vertical']}{RESET}")
+            for wrapped, wrapped_len in wrapped_lines:
+                padding = width - 2 - wrapped_len
+                result.append(f"{color_code}{box['vertical']} {wrapped}{_rule(' ', padding)} {box['vertical']}{RESET}")
         else:
             padding = width - 2 - len(stripped_line)
-            result.append(f"{color_code}{box['vertical']} {line}{' ' * padding} {box['vertical']}{RESET}")
+            result.append(f"{color_code}{box['vertical']} {line}{_rule(' ', padding)} {box['vertical']}{RESET}")
     
     # Create box bottom
-    result.append(f"{color_code}{box['bottom_left']}{box['horizontal'] * width}{box['bottom_right']}{RESET}")
+    result.append(f"{color_code}{box['bottom_left']}{rule}{box['bottom_right']}{RESET}")
     
     return '\n'.join(result)
 
 def strip_ansi_codes(text):
     """Remove ANSI color codes for accurate width calculation"""
-    import re
-    ansi_pattern = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-    return ansi_pattern.sub('', text)
+    return _ANSI_RE.sub('', text)
 
 def format_results(analysis_results, format_type="text", include_contexts=True):
     """
     Formats the analysis results into a readable output
     """
-    # If JSON format is requested, return the JSON string
+    return "".join(iter_format_results(analysis_results, format_type, include_contexts))
+
+def iter_format_results(analysis_results, format_type="text", include_contexts=True):
+    """
+    Yield the formatted analysis results in chunks, one section at a time
+    """
+    # If JSON format is requested, encode with orjson or stream the stdlib encoding
     if format_type == "json":
-        import json
-        return json.dumps(analysis_results, indent=2)
-    
-    results = ""
+        if orjson_available:
+            yield orjson.dumps(analysis_results, option=orjson.OPT_INDENT_2).decode()
+        else:
+            yield from json.JSONEncoder(indent=2).iterencode(analysis_results)
+        return
     
     # Add the header - use format_crypto_banter() to get the red and white logo
-    results += format_crypto_banter()
+    yield format_crypto_banter()
     
     # Create analysis header
     header = create_box(" YOUTUBE TRANSCRIPT ANALYSIS ", width=70, style="double", color="CYAN")
-    results += f"{header}\n\n"
+    yield header
+    yield "\n\n"
     
     # Check if there are any errors
     if 'errors' in analysis_results and analysis_results['errors']:
-        error_content = f"{BOLD}ERRORS DURING ANALYSIS:{RESET}\n\n"
+        error_parts = [f"{BOLD}ERRORS DURING ANALYSIS:{RESET}\n\n"]
         for error in analysis_results['errors']:
-            error_content += f"{RED}• {error}{RESET}\n"
-        results += create_box(error_content, width=70, title="ERRORS", style="rounded", color="RED")
-        results += "\n\n"
+            error_parts.append(f"{RED}• {error}{RESET}\n")
+        yield create_box("".join(error_parts), width=70, title="ERRORS", style="rounded", color="RED")
+        yield "\n\n"
     
     # Create the summary section
     has_timestamps = any(
@@ -165,49 +204,47 @@ def format_results(analysis_results, format_type="text", include_contexts=True):
     else:
         summary_content.append(f"{YELLOW}No timestamps available in transcript{RESET}")
     
-    results += create_box(summary_content, width=70, title="SUMMARY", style="rounded", color="BLUE")
-    results += "\n\n"
+    yield create_box(summary_content, width=70, title="SUMMARY", style="rounded", color="BLUE")
+    yield "\n\n"
     
     # Create the keyword summary table
     if 'keywords' in analysis_results and analysis_results['keywords']:
+        # Pull the per-keyword fields into aligned lists once for both loops below
+        keywords_data = analysis_results['keywords']
+        names = list(keywords_data)
+        datas = list(keywords_data.values())
+        exacts = [data['exact_matches'] for data in datas]
+        partials = [data['partial_matches'] for data in datas]
+        totals = [data['total_matches'] for data in datas]
+        freqs = [data.get('frequency', 0.0) for data in datas]
+        
+        # Color code based on number of matches
+        colors = [GREEN if exact > 5 else YELLOW if exact > 0 else RED for exact in exacts]
+        
         keyword_table = [
             f"{BOLD}KEYWORD SUMMARY{RESET}",
             "",
             f"{BOLD}{'Keyword':<20} {'Exact':^7} {'Partial':^8} {'Total':^7} {'Frequency':^10}{RESET}"
         ]
         
-        for keyword, data in analysis_results['keywords'].items():
-            # Color code based on number of matches
-            color = RED
-            if data['exact_matches'] > 5:
-                color = GREEN
-            elif data['exact_matches'] > 0:
-                color = YELLOW
-                
+        for keyword, exact, partial, total, freq, color in zip(names, exacts, partials, totals, freqs, colors):
             keyword_table.append(
-                f"{color}{keyword:<20} {data['exact_matches']:^7} {data['partial_matches']:^8} "
-                f"{data['total_matches']:^7} {data.get('frequency', 0.0):.2f}%{RESET}"
+                f"{color}{keyword:<20} {exact:^7} {partial:^8} "
+                f"{total:^7} {freq:.2f}%{RESET}"
             )
         
-        results += create_box(keyword_table, width=70, title="KEYWORDS", style="rounded", color="BLUE")
-        results += "\n\n"
+        yield create_box(keyword_table, width=70, title="KEYWORDS", style="rounded", color="BLUE")
+        yield "\n\n"
         
         # Detailed keyword analysis
-        for keyword, data in analysis_results['keywords'].items():
-            # Color based on number of matches
-            color = RED
-            if data['exact_matches'] > 5:
-                color = GREEN
-            elif data['exact_matches'] > 0:
-                color = YELLOW
-                
+        for keyword, data, exact, partial, total, freq, color in zip(names, datas, exacts, partials, totals, freqs, colors):
             keyword_detail = [
                 f"{BOLD}KEYWORD: '{keyword}'{RESET}",
                 "",
-                f"  Exact matches: {BOLD}{color}{data['exact_matches']}{RESET}",
-                f"  Partial matches: {data['partial_matches']}",
-                f"  Total matches: {BOLD}{data['total_matches']}{RESET}",
-                f"  Frequency: {BOLD}{data.get('frequency', 0.0):.2f}%{RESET} of total words",
+                f"  Exact matches: {BOLD}{color}{exact}{RESET}",
+                f"  Partial matches: {partial}",
+                f"  Total matches: {BOLD}{total}{RESET}",
+                f"  Frequency: {BOLD}{freq:.2f}%{RESET} of total words",
                 ""
             ]
             
@@ -242,52 +279,68 @@ def format_results(analysis_results, format_type="text", include_contexts=True):
                     
                     keyword_detail.append("")
             
-            results += create_box(keyword_detail, width=70, title=keyword, style="single", color=color)
-            results += "\n\n"
+            yield create_box(keyword_detail, width=70, title=keyword, style="single", color=color)
+            yield "\n\n"
     
     # Add the footer (only once)
-    results += f"{GREEN}{BOLD}Analysis complete!{RESET}\n"
-    
-    return results
+    yield f"{GREEN}{BOLD}Analysis complete!{RESET}\n"
 
 def format_timestamp(seconds):
     """Format seconds into HH:MM:SS format"""
-    # Convert seconds to float to ensure compatibility
+    # Convert seconds to float to ensure compatibility (numbers skip the conversion)
+    if not isinstance(seconds, (int, float)):
+        try:
+            seconds = float(seconds)
+        except (ValueError, TypeError):
+            # If seconds cannot be converted to float, return a default format
+            return "00:00:00"
+    
+    # Non-negative times only need the whole seconds, split with chained divmods
+    if seconds >= 0:
+        hours, remainder = divmod(int(seconds), 3600)
+        minutes, secs = divmod(remainder, 60)
+        return "%02d:%02d:%02d" % (hours, minutes, secs)
+    
     try:
-        seconds_float = float(seconds)
-        hours = int(seconds_float / 3600)
-        minutes = int((seconds_float % 3600) / 60)
-        secs = int(seconds_float % 60)
+        hours = int(seconds / 3600)
+        minutes = int((seconds % 3600) / 60)
+        secs = int(seconds % 60)
         return f"{hours:02d}:{minutes:02d}:{secs:02d}"
-    except (ValueError, TypeError):
-        # If seconds cannot be converted to float, return a default format
+    except ValueError:
+        # NaN can't be converted to whole seconds
         return "00:00:00"
 
 def highlight_keyword(text, keyword):
     """Highlight the keyword in the text with ANSI colors"""
     # Case-insensitive replacement
-    import re
-    pattern = re.compile(re.escape(keyword), re.IGNORECASE)
+    key = keyword.lower()
+    pattern = _HIGHLIGHT_CACHE.get(key)
+    if pattern is None:
+        pattern = _HIGHLIGHT_CACHE[key] = re.compile(re.escape(keyword), re.IGNORECASE)
     return pattern.sub(f"{BOLD}{GREEN}\\g<0>{RESET}", text)
 
 def split_text(text, width=60):
     """Split text into multiple lines for better readability"""
     words = text.split()
     lines = []
-    current_line = ""
+    current_parts = []
+    current_len = 0
     
+    # Track the line length instead of re-measuring a growing string
     for word in words:
-        if len(current_line) + len(word) + 1 <= width:
-            if current_line:
-                current_line += " " + word
-            else:
-                current_line = word
+        word_len = len(word)
+        if current_len + word_len + 1 <= width:
+            if current_parts:
+                current_len += 1
+            current_parts.append(word)
+            current_len += word_len
         else:
-            lines.append(current_line)
-            current_line = word
+            lines.append(" ".join(current_parts))
+            current_parts = [word]
+            current_len = word_len
     
-    if current_line:
-        lines.append(current_line)
+    if current_parts:
+        lines.append(" ".join(current_parts))
     
     return lines
 
@@ -303,10 +356,70 @@ def save_results(formatted_results, output_file):
         bool: True if successful, False otherwise
     """
     try:
-        with open(output_file, 'w', encoding='utf-8') as f:
+        with atomic_open(output_file, 'w', encoding='utf-8') as f:
             f.write(formatted_results)
         print(f"Results saved to: {output_file}")
         return True
     except Exception as e:
         print(f"Error saving results: {e}")
-        return False 
\ No newline at end of file
+        return False 
+
+def write_json(data, output_file, default=None):
+    """
+    Write data to a file as indented JSON, using orjson when it is available.
+    
+    Args:
+        data (dict): JSON-serializable data
+        output_file (str): Path to output file
+        default (callable): Called to convert objects that can't be serialized
+    """
+    if orjson_available:
+        with atomic_open(output_file, 'wb') as f:
+            f.write(orjson.dumps(data, default=default, option=orjson.OPT_INDENT_2))
+    else:
+        with atomic_open(output_file, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2, default=default)
+
+def read_json(input_file):
+    """
+    Read a JSON file, using orjson when it is available.
+    
+    Args:
+        input_file (str): Path to the JSON file
+        
+    Returns:
+        object: Parsed data
+        
+    Raises:
+        json.JSONDecodeError: If the file is not valid JSON
+    """
+    if orjson_available:
+        # orjson parses straight from the memory-mapped file, without reading
+        # it into a bytes copy first (empty files can't be mapped)
+        with open(input_file, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return orjson.loads(b'')
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped, memoryview(mapped) as view:
+                return orjson.loads(view)
+    with open(input_file, 'r', encoding='utf-8') as f:
+        return json.load(f)
+
+def save_results_streaming(results_iter, output_file):
+    """
+    Save formatted results to a file chunk by chunk without building the full string.
+    
+    Args:
+        results_iter (iterable): Chunks of formatted results, e.g. from iter_format_results()
+        output_file (str): Path to output file
+        
+    Returns:
+        bool: True if successful, False otherwise
+    """
+    try:
+        with atomic_open(output_file, 'w', encoding='utf-8') as f:
+            f.writelines(results_iter)
+        print(f"Results saved to: {output_file}")
+        return True
+    except Exception as e:
+        print(f"Error saving results: {e}")
+        return False
\ No newline at end of file
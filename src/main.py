@@ -3,59 +3,82 @@ Main module for YouTube Whisper Analyzer.
 """
 
 import os
+import itertools
+import shutil
+import tempfile
 import argparse
 import time
 import datetime
 import sys
-import json
-from .downloader import download_audio, extract_video_id
-from .transcriber import transcribe_audio, save_transcript, load_api_key, load_transcript, find_existing_transcript
-from .analyzer import count_keywords, find_related_terms
-from .formatter import format_results, save_results
+import functools
+import importlib.util
+from pathlib import Path
+from .downloader import download_audio, iter_download_audio, extract_video_id, DEFAULT_DOWNLOAD_CONCURRENCY
+from .formatter import format_results, iter_format_results, save_results, save_results_streaming, write_json
 from .cryptobanter import print_crypto_banter
+from .fileio import atomic_open
+from .cache import load_cached_transcript, save_cached_transcript, load_cached_analysis, save_cached_analysis, clear_cache
 
-# Try to load required libraries
-try:
+# Check for optional libraries without importing them (they're loaded on first use)
+rich_available = importlib.util.find_spec("rich") is not None
+questionary_available = importlib.util.find_spec("questionary") is not None
+
+# Choices offered by the interactive mode prompts
+_VIDEO_CHOICES = ("YouTube URL", "Video ID")
+_TRANSCRIPT_CHOICES = (
+    "Download and transcribe new",
+    "Check for existing transcript first",
+    "Specify local transcript file"
+)
+_SAVE_CHOICES = (
+    "Save transcript",
+    {"name": "Save analysis results", "checked": True}
+)
+_OUTPUT_CHOICES = ("text", "json")
+_MODEL_CHOICES = (
+    "whisper-large-v3",
+    "whisper-large-v3-turbo",
+    "distil-whisper-large-v3-en"
+)
+
+@functools.lru_cache(maxsize=1)
+def _console():
+    """Get the shared Rich console, creating it on first use."""
     from rich.console import Console
-    from rich.panel import Panel
-    from rich import print as rprint
-    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn, TimeRemainingColumn
-    rich_available = True
-except ImportError:
-    rich_available = False
+    return Console()
 
-try:
-    import questionary
+@functools.lru_cache(maxsize=1)
+def _questionary_style():
+    """Get the custom questionary style, building it on first use."""
     from questionary import Style
-    questionary_available = True
-except ImportError:
-    questionary_available = False
+    return Style([
+        ('qmark', 'fg:red bold'),
+        ('question', 'fg:white bold'),
+        ('answer', 'fg:green bold'),
+        ('pointer', 'fg:red bold'),
+        ('selected', 'fg:green bold'),
+        ('highlighted', 'fg:red bold'),
+    ])
 
-# Try to load dotenv for environment variables
-try:
-    from dotenv import load_dotenv
-    # Load from .env file in project root
+def load_environment():
+    """
+    Load environment variables from the .env file in the project root.
+    
+    Returns:
+        bool: True if python-dotenv is available, False otherwise
+    """
+    try:
+        from dotenv import load_dotenv
+    except ImportError:
+        return False
+    
     dotenv_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), '.env')
     if os.path.exists(dotenv_path):
         load_dotenv(dotenv_path)
         print("Loaded environment from .env file")
-    dotenv_available = True
-except ImportError:
-    dotenv_available = False
-
-# Set up Rich console
-console = Console() if rich_available else None
-
-# Custom questionary style
-custom_style = Style([
-    ('qmark', 'fg:red bold'),
-    ('question', 'fg:white bold'),
-    ('answer', 'fg:green bold'),
-    ('pointer', 'fg:red bold'),
-    ('selected', 'fg:green bold'),
-    ('highlighted', 'fg:red bold'),
-]) if questionary_available else None
+    return True
 
+@functools.lru_cache(maxsize=1)
 def get_default_model():
     """Get default Whisper model from .env or use hardcoded default"""
     return os.environ.get("WHISPER_MODEL", "whisper-large-v3")
@@ -67,32 +90,37 @@ def interactive_mode():
         print("Please install them with: pip install rich questionary")
         return None
     
+    import questionary
+    from rich.panel import Panel
+    
+    custom_style = _questionary_style()
+    
     # Display welcome banner
     print_crypto_banter()
     
-    console.print(Panel("[bold red]YouTube Whisper Analyzer[/bold red] - [white]Interactive Mode[/white]", 
+    _console().print(Panel("[bold red]YouTube Whisper Analyzer[/bold red] - [white]Interactive Mode[/white]", 
                        border_style="red", expand=False))
     
     # Get YouTube URL or video ID
     url_or_id = questionary.select(
         "How would you like to specify the video?",
-        choices=["YouTube URL", "Video ID"],
+        choices=_VIDEO_CHOICES,
         style=custom_style
     ).ask()
     
     if url_or_id == "YouTube URL":
         url = questionary.text("Enter YouTube URL:", style=custom_style).ask()
         if not url:
-            console.print("[bold red]Error:[/bold red] No URL provided")
+            _console().print("[bold red]Error:[/bold red] No URL provided")
             return None
         video_id = extract_video_id(url)
         if not video_id:
-            console.print("[bold red]Error:[/bold red] Invalid YouTube URL")
+            _console().print("[bold red]Error:[/bold red] Invalid YouTube URL")
             return None
     else:
         video_id = questionary.text("Enter YouTube video ID:", style=custom_style).ask()
         if not video_id:
-            console.print("[bold red]Error:[/bold red] No video ID provided")
+            _console().print("[bold red]Error:[/bold red] No video ID provided")
             return None
         url = f"https://www.youtube.com/watch?v={video_id}"
     
@@ -103,17 +131,13 @@ def interactive_mode():
     ).ask()
     
     if not keywords_str:
-        console.print("[bold red]Error:[/bold red] No keywords provided")
+        _console().print("[bold red]Error:[/bold red] No keywords provided")
         return None
     
     # Ask about transcript options
     transcript_option = questionary.select(
         "Transcript options:",
-        choices=[
-            "Download and transcribe new",
-            "Check for existing transcript first",
-            "Specify local transcript file"
-        ],
+        choices=_TRANSCRIPT_CHOICES,
         style=custom_style
     ).ask()
     
@@ -126,7 +150,7 @@ def interactive_mode():
             style=custom_style
         ).ask()
         if not os.path.exists(transcript_file):
-            console.print(f"[bold red]Error:[/bold red] File not found: {transcript_file}")
+            _console().print(f"[bold red]Error:[/bold red] File not found: {transcript_file}")
             return None
     elif transcript_option == "Check for existing transcript first":
         use_existing = True
@@ -134,10 +158,7 @@ def interactive_mode():
     # Ask about saving options
     save_options = questionary.checkbox(
         "Select save options:",
-        choices=[
-            "Save transcript",
-            {"name": "Save analysis results", "checked": True}
-        ],
+        choices=_SAVE_CHOICES,
         style=custom_style
     ).ask()
     
@@ -147,7 +168,7 @@ def interactive_mode():
     # Ask about output format
     output_format = questionary.select(
         "Select output format for saved results:",
-        choices=["text", "json"],
+        choices=_OUTPUT_CHOICES,
         default="text",
         style=custom_style
     ).ask()
@@ -169,7 +190,7 @@ def interactive_mode():
     
     # Show model information panel
     if rich_available:
-        console.print(Panel(
+        _console().print(Panel(
             "[bold white]Available Whisper Models:[/bold white]\n\n"
             "[bold green]whisper-large-v3[/bold green]: Best accuracy, multilingual support, most detailed\n"
             "[bold yellow]whisper-large-v3-turbo[/bold yellow]: Good balance of speed and accuracy\n"
@@ -183,16 +204,8 @@ def interactive_mode():
     default_model = get_default_model()
     model = questionary.select(
         "Select Whisper model:",
-        choices=[
-            "whisper-large-v3",
-            "whisper-large-v3-turbo",
-            "distil-whisper-large-v3-en"
-        ],
-        default=default_model if default_model in [
-            "whisper-large-v3",
-            "whisper-large-v3-turbo",
-            "distil-whisper-large-v3-en"
-        ] else "whisper-large-v3",
+        choices=_MODEL_CHOICES,
+        default=default_model if default_model in _MODEL_CHOICES else "whisper-large-v3",
         style=custom_style
     ).ask()
     
@@ -208,89 +221,47 @@ def interactive_mode():
         save_results=save_results_opt,
         output_dir=output_dir,
         transcript_file=transcript_file,
-        use_existing_transcript=use_existing
+        use_existing_transcript=use_existing,
+        urls_file=None,
+        download_concurrency=DEFAULT_DOWNLOAD_CONCURRENCY,
+        transcribe_concurrency=None,
+        no_cache=False,
+        clear_cache=False
     )
     
     return args
 
-def main():
-    """Main entry point for the application."""
-    # Check if running in interactive mode
-    if '--interactive' in sys.argv or '-i' in sys.argv:
-        args = interactive_mode()
-        if args is None:
-            return 1
-        # Remove interactive flag for arg parsing
-        if '--interactive' in sys.argv:
-            sys.argv.remove('--interactive')
-        if '-i' in sys.argv:
-            sys.argv.remove('-i')
-    else:
-        # Parse command line arguments
-        parser = argparse.ArgumentParser(description="Analyze keyword frequency in YouTube video transcripts")
+def process_video(args, video_id, keywords, timestamp, audio_file=None):
+    """
+    Load or create the transcript for one video, analyze it and output the results.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        video_id (str): YouTube video ID
+        keywords (list): List of keywords to analyze
+        timestamp (str): Timestamp used in output file names
+        audio_file (str): Path to already downloaded audio (removed by the caller), or None to download it
         
-        # Add URL/ID arguments (mutually exclusive)
-        url_group = parser.add_mutually_exclusive_group(required=True)
-        url_group.add_argument("--url", help="YouTube video URL")
-        url_group.add_argument("--video_id", help="YouTube video ID")
-        
-        # Add other arguments
-        parser.add_argument("--keywords", required=True, help="Comma-separated list of keywords to analyze")
-        parser.add_argument("--output", default="text", choices=["text", "json"], help="Output format (text, json)")
-        parser.add_argument("--model", default=get_default_model(), help="Whisper model to use")
-        parser.add_argument("--api_key", help="Groq API key (alternatively, set GROQ_API_KEY in .env file or environment variable)")
-        parser.add_argument("--save_transcript", action="store_true", help="Save transcript to file")
-        parser.add_argument("--save_results", action="store_true", help="Save analysis results to file")
-        parser.add_argument("--output_dir", default="output", help="Directory for output files")
-        parser.add_argument("--transcript_file", help="Path to local transcript file to use instead of downloading and transcribing")
-        parser.add_argument("--use_existing_transcript", action="store_true", help="Look for existing transcript in output directory before downloading and transcribing")
-        parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive mode")
-        
-        args = parser.parse_args()
-    
-    # Make terminal look fancier with cryptobanter logo
-    if rich_available:
-        print_crypto_banter()
-    
-    # Create timestamp for file naming
-    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
-    
-    # Process URL/video_id
-    video_id = args.video_id if args.video_id else extract_video_id(args.url)
-    if not video_id:
-        if rich_available:
-            console.print("[bold red]Error:[/bold red] Invalid YouTube URL or video ID")
-        else:
-            print("Error: Invalid YouTube URL or video ID")
-        return 1
-    
-    # Process keywords
-    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
-    if not keywords:
-        if rich_available:
-            console.print("[bold red]Error:[/bold red] No valid keywords provided")
-        else:
-            print("Error: No valid keywords provided")
-        return 1
-    
-    # Create output directory if needed
-    if (args.save_transcript or args.save_results) and not os.path.exists(args.output_dir):
-        os.makedirs(args.output_dir)
+    Returns:
+        int: Exit code (0 on success, 1 on failure)
+    """
+    # Imported here so argument errors and --help don't wait on groq and numpy
+    from .transcriber import transcribe_audio, save_transcript, load_transcript, find_existing_transcript, DEFAULT_TRANSCRIBE_CONCURRENCY
+    from .analyzer import count_keywords, find_related_terms
     
     # Initialize variables
     transcript = None
-    audio_file = None
     
     # Check for user-specified transcript file
     if args.transcript_file:
         if rich_available:
-            console.print("\n[bold white on red]LOADING USER-SPECIFIED TRANSCRIPT[/bold white on red]")
+            _console().print("\n[bold white on red]LOADING USER-SPECIFIED TRANSCRIPT[/bold white on red]")
         else:
             print(f"\n=== LOADING USER-SPECIFIED TRANSCRIPT ===")
         transcript = load_transcript(args.transcript_file)
         if not transcript:
             if rich_available:
-                console.print(f"[bold red]Error:[/bold red] Failed to load transcript from {args.transcript_file}")
+                _console().print(f"[bold red]Error:[/bold red] Failed to load transcript from {args.transcript_file}")
             else:
                 print(f"Error: Failed to load transcript from {args.transcript_file}")
             return 1
@@ -298,114 +269,138 @@ def main():
     # Check for existing transcript if enabled
     elif args.use_existing_transcript:
         if rich_available:
-            console.print("\n[bold white on red]CHECKING FOR EXISTING TRANSCRIPT[/bold white on red]")
+            _console().print("\n[bold white on red]CHECKING FOR EXISTING TRANSCRIPT[/bold white on red]")
         else:
             print(f"\n=== CHECKING FOR EXISTING TRANSCRIPT ===")
         existing_transcript_path = find_existing_transcript(video_id, args.output_dir)
         if existing_transcript_path:
             if rich_available:
-                console.print(f"Found existing transcript: [green]{existing_transcript_path}[/green]")
+                _console().print(f"Found existing transcript: [green]{existing_transcript_path}[/green]")
             else:
                 print(f"Found existing transcript: {existing_transcript_path}")
             transcript = load_transcript(existing_transcript_path)
             if transcript:
                 if rich_available:
-                    console.print("[green]Successfully loaded existing transcript[/green]")
+                    _console().print("[green]Successfully loaded existing transcript[/green]")
                 else:
                     print("Successfully loaded existing transcript")
             else:
                 if rich_available:
-                    console.print("[yellow]Failed to load existing transcript, will download and transcribe instead[/yellow]")
+                    _console().print("[yellow]Failed to load existing transcript, will download and transcribe instead[/yellow]")
                 else:
                     print("Failed to load existing transcript, will download and transcribe instead")
     
-    # Download and transcribe if needed
-    if transcript is None:
-        # Step 1: Download audio
-        if rich_available:
-            console.print("\n[bold white on red]STEP 1: DOWNLOADING YOUTUBE AUDIO[/bold white on red]")
-        else:
-            print(f"\n=== STEP 1: DOWNLOADING YOUTUBE AUDIO ===")
-        output_filename = f"yt_{video_id}"
-        audio_file = download_audio(video_id, output_filename)
-        if not audio_file:
+    # Transcripts loaded from a file in the output directory don't need saving again
+    transcript_from_file = transcript is not None
+    
+    # Reuse a transcript cached by an earlier run with the same model
+    if transcript is None and not args.no_cache:
+        cached_transcript = load_cached_transcript(video_id, args.model)
+        if cached_transcript:
+            transcript = cached_transcript
             if rich_available:
-                console.print("[bold red]Error:[/bold red] Failed to download audio")
+                _console().print(f"[green]Using cached transcript for {video_id}[/green]")
             else:
-                print("Error: Failed to download audio")
-            return 1
-        
-        # Step 2: Transcribe audio
-        if rich_available:
-            console.print("\n[bold white on red]STEP 2: TRANSCRIBING AUDIO[/bold white on red]")
-        else:
-            print(f"\n=== STEP 2: TRANSCRIBING AUDIO ===")
-        transcript = transcribe_audio(audio_file, args.api_key, args.model)
-        if not transcript:
+                print(f"Using cached transcript for {video_id}")
+    
+    # Download and transcribe if needed
+    if transcript is None:
+        # Audio is downloaded into a temporary directory that is removed as soon as
+        # transcription finishes, even if it fails or the run is interrupted
+        with tempfile.TemporaryDirectory(prefix="ytwa_") as temp_dir:
+            # Step 1: Download audio (unless it was already downloaded in batch mode)
+            if audio_file is None:
+                if rich_available:
+                    _console().print("\n[bold white on red]STEP 1: DOWNLOADING YOUTUBE AUDIO[/bold white on red]")
+                else:
+                    print(f"\n=== STEP 1: DOWNLOADING YOUTUBE AUDIO ===")
+                audio_file = download_audio(video_id, os.path.join(temp_dir, f"yt_{video_id}"))
+            if not audio_file:
+                if rich_available:
+                    _console().print("[bold red]Error:[/bold red] Failed to download audio")
+                else:
+                    print("Error: Failed to download audio")
+                return 1
+            
+            # Step 2: Transcribe audio
             if rich_available:
-                console.print("[bold red]Error:[/bold red] Failed to transcribe audio")
+                _console().print("\n[bold white on red]STEP 2: TRANSCRIBING AUDIO[/bold white on red]")
             else:
-                print("Error: Failed to transcribe audio")
-            # Clean up audio file
-            if os.path.exists(audio_file):
-                os.remove(audio_file)
-            return 1
+                print(f"\n=== STEP 2: TRANSCRIBING AUDIO ===")
+            concurrency = args.transcribe_concurrency or DEFAULT_TRANSCRIBE_CONCURRENCY
+            transcript = transcribe_audio(audio_file, args.api_key, args.model, concurrency, use_cache=not args.no_cache)
+            if not transcript:
+                if rich_available:
+                    _console().print("[bold red]Error:[/bold red] Failed to transcribe audio")
+                else:
+                    print("Error: Failed to transcribe audio")
+                return 1
         
-        # Save transcript if requested or if use_existing_transcript is enabled
-        # (so it will be available for future runs)
-        if args.save_transcript or args.use_existing_transcript:
-            transcript_file = os.path.join(args.output_dir, f"transcript_{video_id}_{timestamp}.txt")
-            save_transcript(transcript, transcript_file)
+        if not args.no_cache:
+            save_cached_transcript(video_id, args.model, transcript)
     else:
         if rich_available:
-            console.print("\n[bold white on red]USING EXISTING TRANSCRIPT[/bold white on red]")
-            console.print("[green]Skipped downloading and transcribing[/green]")
+            _console().print("\n[bold white on red]USING EXISTING TRANSCRIPT[/bold white on red]")
+            _console().print("[green]Skipped downloading and transcribing[/green]")
         else:
             print(f"\n=== USING EXISTING TRANSCRIPT ===")
             print(f"Skipped downloading and transcribing")
     
-    # Step 3: Analyze transcript
-    if rich_available:
-        console.print("\n[bold white on red]STEP 3: ANALYZING TRANSCRIPT[/bold white on red]")
-        with Progress(
-            SpinnerColumn(),
-            TextColumn("[bold white]Analyzing keywords..."),
-            BarColumn(),
-            TaskProgressColumn(),
-            console=console
-        ) as progress:
-            task = progress.add_task("[white]Analyzing...", total=1)
+    # Save transcript if requested or if use_existing_transcript is enabled
+    # (so it will be available for future runs), including cached transcripts
+    if not transcript_from_file and (args.save_transcript or args.use_existing_transcript):
+        transcript_file = os.path.join(args.output_dir, f"transcript_{video_id}_{timestamp}.txt")
+        save_transcript(transcript, transcript_file)
+    
+    # Step 3: Analyze transcript (reusing results from an earlier identical run)
+    analysis_results = None if args.no_cache else load_cached_analysis(transcript, keywords)
+    if analysis_results is not None:
+        if rich_available:
+            _console().print("\n[bold white on red]STEP 3: USING CACHED ANALYSIS[/bold white on red]")
+        else:
+            print(f"\n=== STEP 3: USING CACHED ANALYSIS ===")
+    else:
+        if rich_available:
+            from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn, TaskProgressColumn
+            
+            _console().print("\n[bold white on red]STEP 3: ANALYZING TRANSCRIPT[/bold white on red]")
+            with Progress(
+                SpinnerColumn(),
+                TextColumn("[bold white]Analyzing keywords..."),
+                BarColumn(),
+                TaskProgressColumn(),
+                console=_console()
+            ) as progress:
+                task = progress.add_task("[white]Analyzing...", total=1)
+                analysis_results = count_keywords(transcript, keywords)
+                progress.update(task, advance=0.5)
+                
+                # Find related terms
+                related_terms = find_related_terms(transcript, keywords)
+                if related_terms:
+                    analysis_results["related_terms"] = related_terms
+                progress.update(task, advance=0.5)
+        else:
+            print(f"\n=== STEP 3: ANALYZING TRANSCRIPT ===")
             analysis_results = count_keywords(transcript, keywords)
-            progress.update(task, advance=0.5)
             
             # Find related terms
             related_terms = find_related_terms(transcript, keywords)
             if related_terms:
                 analysis_results["related_terms"] = related_terms
-            progress.update(task, advance=0.5)
-    else:
-        print(f"\n=== STEP 3: ANALYZING TRANSCRIPT ===")
-        analysis_results = count_keywords(transcript, keywords)
         
-        # Find related terms
-        related_terms = find_related_terms(transcript, keywords)
-        if related_terms:
-            analysis_results["related_terms"] = related_terms
+        if not args.no_cache and 'error' not in analysis_results:
+            save_cached_analysis(transcript, keywords, analysis_results)
     
     # Step 4: Format and output results
     if rich_available:
-        console.print("\n[bold white on red]STEP 4: FORMATTING RESULTS[/bold white on red]")
+        _console().print("\n[bold white on red]STEP 4: FORMATTING RESULTS[/bold white on red]")
     else:
         print(f"\n=== STEP 4: FORMATTING RESULTS ===")
     
-    # Always format results as text for display
-    formatted_results_display = format_results(analysis_results, "text")
-    
-    # Format results in requested format for saving
-    if args.output != "text":
-        formatted_results_save = format_results(analysis_results, args.output)
-    else:
-        formatted_results_save = formatted_results_display
+    # Always format results as text for display. For JSON output the full detail
+    # goes to the file, so only show the summary and per-keyword counts here.
+    formatted_results_display = format_results(analysis_results, "text", include_contexts=args.output == "text")
     
     # Print results
     print("\n" + formatted_results_display)
@@ -413,75 +408,255 @@ def main():
     # Save results if requested
     if args.save_results:
         results_file = os.path.join(args.output_dir, f"analysis_{video_id}_{timestamp}.{args.output}")
-        save_results(formatted_results_save, results_file)
+        if args.output != "text":
+            # Stream other formats straight to the file instead of building a second string
+            results_saved = save_results_streaming(iter_format_results(analysis_results, args.output), results_file)
+        else:
+            results_saved = save_results(formatted_results_display, results_file)
         
         # Also save raw analysis results in JSON format for later viewing
         raw_results_file = os.path.join(args.output_dir, f"analysis_{video_id}_{timestamp}_raw.json")
         try:
-            # Create a serializable copy of the results
-            serializable_results = {}
-            
-            # Copy basic data
-            for key in ['total_words', 'total_matches', 'has_timestamps']:
-                if key in analysis_results:
-                    serializable_results[key] = analysis_results[key]
-                    
-            # Handle keywords and contexts
-            if 'keywords' in analysis_results:
-                serializable_results['keywords'] = {}
-                for keyword, data in analysis_results['keywords'].items():
-                    serializable_results['keywords'][keyword] = {
-                        'exact_matches': data.get('exact_matches', 0),
-                        'partial_matches': data.get('partial_matches', 0),
-                        'total_matches': data.get('total_matches', 0),
-                        'frequency': data.get('frequency', 0.0)
-                    }
-                    
-                    # Handle contexts
-                    if 'contexts' in data:
-                        serializable_results['keywords'][keyword]['contexts'] = []
-                        for ctx in data['contexts']:
-                            context_copy = {
-                                'text': ctx.get('text', ''),
-                                'position': ctx.get('position', 0)
-                            }
-                            
-                            # Handle timestamp objects
-                            if 'timestamp' in ctx:
-                                context_copy['timestamp'] = {
-                                    'start': ctx['timestamp'].get('start', '00:00:00'),
-                                    'end': ctx['timestamp'].get('end', '00:00:00')
-                                }
-                                
-                            serializable_results['keywords'][keyword]['contexts'].append(context_copy)
-            
-            # Save serialized data
-            with open(raw_results_file, 'w', encoding='utf-8') as f:
-                json.dump(serializable_results, f, indent=2)
+            if args.output == "json" and results_saved:
+                # The JSON results file already holds the same document, so copy
+                # it rather than encoding the results a second time
+                with open(results_file, 'rb') as src, atomic_open(raw_results_file, 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+            else:
+                # The analysis results are plain dicts and lists, so write them directly
+                write_json(analysis_results, raw_results_file)
             
             if rich_available:
-                console.print(f"Results saved to: [green]{results_file}[/green]")
-                console.print(f"Raw analysis data saved to: [green]{raw_results_file}[/green]")
-                console.print(f"To view formatted results later, run: [yellow]python view_analysis.py {raw_results_file}[/yellow]")
+                _console().print(f"Results saved to: [green]{results_file}[/green]")
+                _console().print(f"Raw analysis data saved to: [green]{raw_results_file}[/green]")
+                _console().print(f"To view formatted results later, run: [yellow]python view_analysis.py {raw_results_file}[/yellow]")
             else:
                 print(f"Results saved to: {results_file}")
                 print(f"Raw analysis data saved to: {raw_results_file}")
                 print(f"To view formatted results later, run: python view_analysis.py {raw_results_file}")
         except Exception as e:
             if rich_available:
-                console.print(f"[bold red]Error saving raw analysis data:[/bold red] {e}")
+                _console().print(f"[bold red]Error saving raw analysis data:[/bold red] {e}")
             else:
                 print(f"Error saving raw analysis data: {e}")
     
-    # Clean up audio file
-    if audio_file and os.path.exists(audio_file):
-        os.remove(audio_file)
+    return 0
+
+def read_urls_file(urls_file):
+    """
+    Read YouTube URLs or video IDs from a file, one per line.
+    
+    Blank lines and lines starting with '#' are ignored.
+    
+    Args:
+        urls_file (str): Path to the file, or '-' to read from standard input
+        
+    Returns:
+        list: URLs or video IDs in file order
+    """
+    if urls_file == '-':
+        return [line.strip() for line in sys.stdin if line.strip() and not line.strip().startswith('#')]
+    with open(urls_file, 'r', encoding='utf-8') as f:
+        return [line.strip() for line in f if line.strip() and not line.strip().startswith('#')]
+
+def run_batch(args, keywords, timestamp):
+    """
+    Analyze every video listed in args.urls_file, downloading audio concurrently.
+    
+    Args:
+        args (argparse.Namespace): Parsed command line arguments
+        keywords (list): List of keywords to analyze
+        timestamp (str): Timestamp used in output file names
+        
+    Returns:
+        int: Exit code (0 if every video succeeded, 1 otherwise)
+    """
+    from .transcriber import find_existing_transcript
+    
+    try:
+        entries = read_urls_file(args.urls_file)
+    except OSError as e:
         if rich_available:
-            console.print(f"\n[green]Cleaned up temporary audio file[/green]")
+            _console().print(f"[bold red]Error:[/bold red] Failed to read URLs file: {e}")
+        else:
+            print(f"Error: Failed to read URLs file: {e}")
+        return 1
+    
+    video_ids = []
+    for entry in entries:
+        video_id = extract_video_id(entry)
+        if video_id:
+            video_ids.append(video_id)
+        elif rich_available:
+            _console().print(f"[yellow]Skipping invalid YouTube URL or video ID: {entry}[/yellow]")
         else:
-            print(f"\nCleaned up temporary audio file")
+            print(f"Skipping invalid YouTube URL or video ID: {entry}")
+    video_ids = list(dict.fromkeys(video_ids))
+    
+    if not video_ids:
+        if rich_available:
+            _console().print("[bold red]Error:[/bold red] No valid YouTube URLs or video IDs in URLs file")
+        else:
+            print("Error: No valid YouTube URLs or video IDs in URLs file")
+        return 1
+    
+    # Videos with a reusable or cached transcript don't need their audio
+    to_download = [
+        video_id for video_id in video_ids
+        if not (args.use_existing_transcript and find_existing_transcript(video_id, args.output_dir))
+        and (args.no_cache or not load_cached_transcript(video_id, args.model))
+    ]
+    
+    # Downloaded audio goes into a temporary directory that is removed when the
+    # batch ends, even if it fails, is interrupted or leaves downloads unconsumed
+    download_dir = tempfile.mkdtemp(prefix="ytwa_")
+    try:
+        # Start the downloads in the background and process each video as soon as
+        # its audio is ready, so transcription overlaps the remaining downloads
+        downloads = iter(())
+        if to_download:
+            if rich_available:
+                _console().print(f"\n[bold white on red]STEP 1: DOWNLOADING AUDIO FOR {len(to_download)} VIDEOS[/bold white on red]")
+            else:
+                print(f"\n=== STEP 1: DOWNLOADING AUDIO FOR {len(to_download)} VIDEOS ===")
+            downloads = iter_download_audio(to_download, args.download_concurrency, output_dir=download_dir)
+        
+        # Videos that need no download go first, then downloads in completion order
+        download_set = set(to_download)
+        ready = ((video_id, None) for video_id in video_ids if video_id not in download_set)
+        
+        failures = 0
+        for i, (video_id, audio_file) in enumerate(itertools.chain(ready, downloads), 1):
+            if rich_available:
+                _console().print(f"\n[bold white on red]VIDEO {i}/{len(video_ids)}: {video_id}[/bold white on red]")
+            else:
+                print(f"\n=== VIDEO {i}/{len(video_ids)}: {video_id} ===")
+            
+            if video_id in download_set and not audio_file:
+                if rich_available:
+                    _console().print("[bold red]Error:[/bold red] Failed to download audio")
+                else:
+                    print("Error: Failed to download audio")
+                failures += 1
+                continue
+            
+            try:
+                if process_video(args, video_id, keywords, timestamp, audio_file) != 0:
+                    failures += 1
+            finally:
+                # Free the disk space before moving on to the next video
+                if audio_file and os.path.exists(audio_file):
+                    os.remove(audio_file)
+    finally:
+        # Workers may still be writing if the batch was interrupted, so ignore errors
+        shutil.rmtree(download_dir, ignore_errors=True)
+    
+    if failures:
+        if rich_available:
+            _console().print(f"\n[bold red]{failures} of {len(video_ids)} videos failed[/bold red]")
+        else:
+            print(f"\n{failures} of {len(video_ids)} videos failed")
+        return 1
     
     return 0
 
+@functools.lru_cache(maxsize=1)
+def _build_parser():
+    """
+    Build the command line argument parser (once per process).
+    
+    Returns:
+        argparse.ArgumentParser: Parser for the command line options
+    """
+    parser = argparse.ArgumentParser(description="Analyze keyword frequency in YouTube video transcripts")
+    
+    # Add URL/ID arguments (mutually exclusive)
+    url_group = parser.add_mutually_exclusive_group(required=True)
+    url_group.add_argument("--url", help="YouTube video URL")
+    url_group.add_argument("--video_id", help="YouTube video ID")
+    url_group.add_argument("--urls_file", help="File with one YouTube URL or video ID per line to analyze in batch ('-' reads standard input)")
+    
+    # Add other arguments
+    parser.add_argument("--keywords", required=True, help="Comma-separated list of keywords to analyze")
+    parser.add_argument("--output", default="text", choices=["text", "json"], help="Output format (text, json)")
+    parser.add_argument("--model", help="Whisper model to use (default: WHISPER_MODEL from the environment or whisper-large-v3)")
+    parser.add_argument("--api_key", help="Groq API key (alternatively, set GROQ_API_KEY in .env file or environment variable)")
+    parser.add_argument("--save_transcript", action="store_true", help="Save transcript to file")
+    parser.add_argument("--save_results", action="store_true", help="Save analysis results to file")
+    parser.add_argument("--output_dir", default="output", help="Directory for output files")
+    parser.add_argument("--transcript_file", help="Path to local transcript file to use instead of downloading and transcribing")
+    parser.add_argument("--use_existing_transcript", action="store_true", help="Look for existing transcript in output directory before downloading and transcribing")
+    parser.add_argument("--download_concurrency", type=int, default=DEFAULT_DOWNLOAD_CONCURRENCY, help="Number of concurrent downloads in batch mode")
+    parser.add_argument("--transcribe_concurrency", type=int, help="Number of audio chunks transcribed at the same time for large files (default: 4)")
+    parser.add_argument("--no_cache", action="store_true", help="Don't read or write the transcript, chunk and analysis cache")
+    parser.add_argument("--clear_cache", action="store_true", help="Clear the transcript and analysis cache before running")
+    parser.add_argument("--interactive", "-i", action="store_true", help="Run in interactive mode")
+    
+    return parser
+
+def main():
+    """Main entry point for the application."""
+    # Check if running in interactive mode
+    if '--interactive' in sys.argv or '-i' in sys.argv:
+        # Load .env before reading defaults such as WHISPER_MODEL
+        load_environment()
+        args = interactive_mode()
+        if args is None:
+            return 1
+        # Remove interactive flag for arg parsing
+        if '--interactive' in sys.argv:
+            sys.argv.remove('--interactive')
+        if '-i' in sys.argv:
+            sys.argv.remove('-i')
+    else:
+        # Parse command line arguments
+        args = _build_parser().parse_args()
+        
+        # Environment defaults are only needed once --help and argument errors are out of the way
+        load_environment()
+        args.model = args.model or get_default_model()
+    
+    # Make terminal look fancier with cryptobanter logo
+    if rich_available:
+        print_crypto_banter()
+    
+    # Create timestamp for file naming
+    timestamp = datetime.datetime.now().strftime("%Y%m%d_%H%M%S")
+    
+    # Clear cached transcripts if requested
+    if args.clear_cache:
+        clear_cache()
+    
+    # Process URL/video_id
+    batch_mode = bool(args.urls_file)
+    video_id = None
+    if not batch_mode:
+        video_id = args.video_id if args.video_id else extract_video_id(args.url)
+    if not batch_mode and not video_id:
+        if rich_available:
+            _console().print("[bold red]Error:[/bold red] Invalid YouTube URL or video ID")
+        else:
+            print("Error: Invalid YouTube URL or video ID")
+        return 1
+    
+    # Process keywords
+    keywords = [k.strip() for k in args.keywords.split(",") if k.strip()]
+    if not keywords:
+        if rich_available:
+            _console().print("[bold red]Error:[/bold red] No valid keywords provided")
+        else:
+            print("Error: No valid keywords provided")
+        return 1
+    
+    # Create output directory if needed
+    if args.save_transcript or args.save_results:
+        Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+    
+    # Analyze every video from the URLs file
+    if batch_mode:
+        return run_batch(args, keywords, timestamp)
+    
+    return process_video(args, video_id, keywords, timestamp)
+
 if __name__ == "__main__":
     exit(main()) 
\ No newline at end of file
@@ -3,14 +3,21 @@ Module for transcribing audio using Whisper API via Groq.
 """
 
 import os
+import re
 import json
+import string
+import difflib
+import itertools
 import tempfile
 import subprocess
 import shutil
-import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 from groq import Groq
-from pydub import AudioSegment
+from .fileio import atomic_open
+from .formatter import write_json, read_json
+from .cache import hash_audio_file, load_cached_chunk, save_cached_chunk
 
 # Try to load rich for better UI
 try:
@@ -31,6 +38,14 @@ except ImportError:
 # Set up Rich console
 console = Console() if rich_available else None
 
+# Try to load mutagen for reading MP3 durations without spawning ffprobe
+try:
+    from mutagen import MutagenError
+    from mutagen.mp3 import MP3
+    mutagen_available = True
+except ImportError:
+    mutagen_available = False
+
 # Import dotenv for loading environment variables
 try:
     from dotenv import load_dotenv
@@ -44,6 +59,26 @@ MAX_FILE_SIZE = 25 * 1024 * 1024
 # Default chunk duration in milliseconds (5 minutes)
 DEFAULT_CHUNK_DURATION = 5 * 60 * 1000
 
+# Overlap between consecutive chunks in milliseconds, so words at a boundary
+# are heard whole in at least one chunk
+DEFAULT_CHUNK_OVERLAP = 2 * 1000
+
+# Maximum number of ffmpeg processes cutting chunks at the same time
+MAX_SPLIT_WORKERS = 8
+
+# Words compared on each side of a chunk boundary when merging the overlap
+OVERLAP_MERGE_WORDS = 20
+
+# Whitespace-separated words, used to align overlapping chunk transcripts
+_WORD_RE = re.compile(r'\S+')
+
+# Number of chunks sent to the API at the same time
+DEFAULT_TRANSCRIBE_CONCURRENCY = 4
+
+# Retries for a failed API request. The Groq client backs off exponentially
+# with jitter and honours Retry-After on rate limit (429) responses.
+API_MAX_RETRIES = 5
+
 def load_api_key():
     """
     Load Groq API key from .env file or environment variables.
@@ -68,6 +103,22 @@ def load_api_key():
     api_key = os.environ.get("GROQ_API_KEY")
     return api_key
 
+@lru_cache(maxsize=4)
+def _get_client(api_key):
+    """
+    Get a Groq client for an API key, creating it on first use.
+    
+    Reusing the client keeps its HTTP connection pool, so later files and
+    batch videos don't pay for a new TLS handshake.
+    
+    Args:
+        api_key (str): API key for Groq
+        
+    Returns:
+        Groq: Client instance
+    """
+    return Groq(api_key=api_key, max_retries=API_MAX_RETRIES)
+
 def get_file_size(file_path):
     """
     Get the size of a file in bytes.
@@ -80,10 +131,13 @@ def get_file_size(file_path):
     """
     return os.path.getsize(file_path)
 
+@lru_cache(maxsize=1)
 def find_ffmpeg_tools():
     """
     Find ffmpeg and ffprobe executables in the system or project directory.
     
+    The result is cached, so the search runs (and is reported) once per process.
+    
     Returns:
         tuple: (ffmpeg_path, ffprobe_path) or (None, None) if not found
     """
@@ -104,14 +158,12 @@ def find_ffmpeg_tools():
     ffmpeg_names = ['ffmpeg', 'ffmpeg.exe']
     ffprobe_names = ['ffprobe', 'ffprobe.exe']
     
-    # Check in PATH
+    # Check in PATH (each lookup walks every PATH directory, so do it once per name)
     for name in ffmpeg_names:
-        if not ffmpeg_path and shutil.which(name):
-            ffmpeg_path = shutil.which(name)
+        ffmpeg_path = ffmpeg_path or shutil.which(name)
     
     for name in ffprobe_names:
-        if not ffprobe_path and shutil.which(name):
-            ffprobe_path = shutil.which(name)
+        ffprobe_path = ffprobe_path or shutil.which(name)
     
     # Check in common locations
     common_locations = [
@@ -152,7 +204,106 @@ def find_ffmpeg_tools():
     
     return ffmpeg_path, ffprobe_path
 
-def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_CHUNK_DURATION):
+def track_progress(items, total, description):
+    """
+    Iterate over items while showing a progress bar.
+    
+    Uses rich when available, then tqdm, and otherwise yields the items
+    without a bar.
+    
+    Args:
+        items (iterable): Items to iterate over
+        total (int): Number of items expected
+        description (str): Label shown next to the bar
+        
+    Yields:
+        object: Each item, after the bar has been shown
+    """
+    if rich_available:
+        with Progress(
+            SpinnerColumn(),
+            TextColumn(f"[bold green]{description}..."),
+            BarColumn(),
+            TaskProgressColumn(),
+            TimeRemainingColumn(),
+            console=console
+        ) as progress:
+            task = progress.add_task(description, total=total)
+            for item in items:
+                yield item
+                progress.update(task, advance=1)
+    elif tqdm_available:
+        yield from tqdm(items, total=total, desc=description)
+    else:
+        yield from items
+
+def probe_audio(audio_file, ffprobe_path=None):
+    """
+    Get the duration and codec of an audio file.
+    
+    MP3 files are read with mutagen when it is installed, which parses the
+    frame headers in-process; anything else goes through ffprobe. Results are
+    cached until the file changes.
+    
+    Args:
+        audio_file (str): Path to the audio file
+        ffprobe_path (str): Path to ffprobe executable, or None if not found
+        
+    Returns:
+        tuple: (duration in seconds, codec name) or None if it could not be determined
+    """
+    stat = os.stat(audio_file)
+    return _probe_audio(audio_file, ffprobe_path, stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=32)
+def _probe_audio(audio_file, ffprobe_path, mtime_ns, size):
+    """
+    Probe an audio file (see probe_audio).
+    
+    Args:
+        audio_file (str): Path to the audio file
+        ffprobe_path (str): Path to ffprobe executable, or None if not found
+        mtime_ns (int): Modification time of the file, part of the cache key
+        size (int): Size of the file in bytes, part of the cache key
+        
+    Returns:
+        tuple: (duration in seconds, codec name) or None if it could not be determined
+    """
+    if mutagen_available and audio_file.lower().endswith('.mp3'):
+        try:
+            return MP3(audio_file).info.length, "mp3"
+        except (MutagenError, OSError):
+            pass
+    
+    if not ffprobe_path:
+        if rich_available:
+            console.print("[bold red]Error:[/bold red] ffprobe not found. Cannot determine audio duration.")
+        else:
+            print("Error: ffprobe not found. Cannot determine audio duration.")
+        return None
+    
+    command = [
+        ffprobe_path, 
+        "-v", "error", 
+        "-select_streams", "a:0",
+        "-show_entries", "format=duration:stream=codec_name", 
+        "-of", "json",
+        audio_file
+    ]
+    
+    result = subprocess.run(command, capture_output=True, text=True)
+    if result.returncode != 0:
+        if rich_available:
+            console.print(f"[bold red]Error:[/bold red] Failed to get audio duration: {result.stderr}")
+        else:
+            print(f"Error: Failed to get audio duration: {result.stderr}")
+        return None
+    
+    probe = json.loads(result.stdout)
+    streams = probe.get('streams') or [{}]
+    return float(probe['format']['duration']), streams[0].get('codec_name')
+
+def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_CHUNK_DURATION, on_chunk=None, overlap=DEFAULT_CHUNK_OVERLAP, file_size=None, output_dir=None):
     """
     Split audio file into chunks using ffmpeg.
     
@@ -160,21 +311,22 @@ def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_durat
         audio_file (str): Path to the audio file
         max_size (int): Maximum size of each chunk in bytes
         chunk_duration (int): Target duration for each chunk in milliseconds
+        on_chunk (callable): Called with each chunk path and its start time in
+            seconds as soon as it is created (not necessarily in order), so it
+            can be processed while the remaining chunks are encoded
+        overlap (int): Audio repeated from the end of the previous chunk at the
+            start of each chunk, in milliseconds
+        file_size (int): Size of the audio file in bytes if the caller already
+            knows it (looked up otherwise)
+        output_dir (str): Directory to write the chunks to (default: a new
+            temporary directory the caller is responsible for removing)
         
     Returns:
         list: List of paths to the created chunks
     """
     try:
-        # First get the audio file duration using ffprobe
         ffmpeg_path, ffprobe_path = find_ffmpeg_tools()
         
-        if not ffprobe_path:
-            if rich_available:
-                console.print("[bold red]Error:[/bold red] ffprobe not found. Cannot determine audio duration.")
-            else:
-                print("Error: ffprobe not found. Cannot determine audio duration.")
-            return None
-            
         if not ffmpeg_path:
             if rich_available:
                 console.print("[bold red]Error:[/bold red] ffmpeg not found. Cannot split audio file.")
@@ -182,38 +334,52 @@ def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_durat
                 print("Error: ffmpeg not found. Cannot split audio file.")
             return None
         
-        # Get duration using ffprobe
         if rich_available:
             console.print(f"Using ffmpeg at: [green]{ffmpeg_path}[/green]")
         else:
             print(f"Using ffmpeg at: {ffmpeg_path}")
-            
-        command = [
-            ffprobe_path, 
-            "-v", "error", 
-            "-show_entries", "format=duration", 
-            "-of", "default=noprint_wrappers=1:nokey=1",
-            audio_file
-        ]
         
-        result = subprocess.run(command, capture_output=True, text=True)
-        if result.returncode != 0:
-            if rich_available:
-                console.print(f"[bold red]Error:[/bold red] Failed to get audio duration: {result.stderr}")
-            else:
-                print(f"Error: Failed to get audio duration: {result.stderr}")
+        # Get the audio duration and codec
+        probe = probe_audio(audio_file, ffprobe_path)
+        if not probe:
             return None
-            
-        duration = float(result.stdout.strip())
+        duration, codec_name = probe
         
         if rich_available:
             console.print(f"Audio duration: [green]{duration:.2f}[/green] seconds")
         else:
             print(f"Audio duration: {duration:.2f} seconds")
         
-        # Calculate number of chunks
+        # Calculate number of chunks (ceiling division in whole milliseconds, so
+        # float noise in the probed duration can't add a near-empty chunk)
+        duration_ms = round(duration * 1000)
+        num_chunks = max(1, -(-duration_ms // chunk_duration))
         chunk_duration_seconds = chunk_duration / 1000
-        num_chunks = max(1, int(duration / chunk_duration_seconds) + (1 if duration % chunk_duration_seconds > 0 else 0))
+        
+        # Spread the audio evenly over the chunks instead of leaving a short
+        # last one, so concurrent uploads finish at about the same time
+        if duration > 0:
+            chunk_duration_seconds = duration / num_chunks
+        
+        # Each chunk after the first starts this much before its share of the audio
+        overlap_seconds = overlap / 1000 if num_chunks > 1 else 0
+        
+        # MP3 input (what yt-dlp produces) can be cut without re-encoding, as
+        # long as chunks at the source bitrate stay under the size limit
+        if file_size is None:
+            file_size = get_file_size(audio_file)
+        expected_chunk_size = file_size / duration * (chunk_duration_seconds + overlap_seconds) if duration > 0 else max_size
+        stream_copy = codec_name == "mp3" and expected_chunk_size < max_size * 0.9
+        if stream_copy:
+            codec_options = ["-c:a", "copy"]
+            if rich_available:
+                console.print("Input is MP3, cutting chunks [green]without re-encoding[/green]")
+            else:
+                print("Input is MP3, cutting chunks without re-encoding")
+        else:
+            # libmp3lame is single-threaded, so speed comes from its algorithm
+            # setting (0 is slowest, 9 fastest); 7 is plenty for speech recognition
+            codec_options = ["-acodec", "libmp3lame", "-ab", "128k", "-ar", "44100", "-compression_level", "7"]
         
         if rich_available:
             console.print(f"Splitting into approximately [green]{num_chunks}[/green] chunks...")
@@ -221,91 +387,76 @@ def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_durat
             print(f"Splitting into approximately {num_chunks} chunks...")
         
         # Create a temporary directory for chunks
-        temp_dir = tempfile.mkdtemp()
-        chunks = []
+        temp_dir = output_dir or tempfile.mkdtemp()
+        created = {}
         
-        # Set up progress tracking
-        if rich_available:
-            progress = Progress(
-                SpinnerColumn(),
-                TextColumn("[bold green]Creating chunk {task.fields[chunk_num]}/{task.fields[total_chunks]}..."),
-                BarColumn(),
-                TaskProgressColumn(),
-                TimeRemainingColumn(),
-                console=console
-            )
-            task = progress.add_task("[green]Splitting audio...", total=num_chunks, chunk_num=0, total_chunks=num_chunks)
-            with progress:
-                for i in range(num_chunks):
-                    progress.update(task, advance=0, chunk_num=i+1)
-                    
-                    # Calculate start and end times for this chunk
-                    start_time = i * chunk_duration_seconds
-                    
-                    # Create output path for this chunk
-                    output_path = os.path.join(temp_dir, f"chunk_{i}.mp3")
-                    
-                    # Build ffmpeg command
-                    command = [
-                        ffmpeg_path,
-                        "-i", audio_file,
-                        "-ss", str(start_time),
-                        "-t", str(chunk_duration_seconds),
-                        "-acodec", "libmp3lame",
-                        "-ab", "128k",
-                        "-ar", "44100",
-                        "-y",  # Overwrite output files without asking
-                        output_path
-                    ]
-                    
-                    # Run ffmpeg
-                    subprocess.run(command, capture_output=True)
-                    
-                    # Check if the chunk was created
-                    if os.path.exists(output_path):
-                        chunk_size = get_file_size(output_path) / (1024 * 1024)  # Size in MB
+        def create_chunk(i):
+            """Cut chunk i and return (path, start time, size in MB or None if it was not created)."""
+            # Each chunk after the first also covers the end of the previous one
+            start_time = max(0.0, i * chunk_duration_seconds - overlap_seconds)
+            end_time = (i + 1) * chunk_duration_seconds
+            output_path = os.path.join(temp_dir, f"chunk_{i}.mp3")
+            
+            # Build ffmpeg command (-ss before -i seeks in the input instead of
+            # decoding everything before the chunk)
+            command = [
+                ffmpeg_path,
+                "-nostdin", "-nostats",
+                "-loglevel", "error",  # Only errors are written to stderr
+                "-ss", str(start_time),
+                "-t", str(end_time - start_time),
+                "-i", audio_file,
+                "-map", "0:a:0",
+                *codec_options,
+                "-y",  # Overwrite output files without asking
+                output_path
+            ]
+            
+            # Run ffmpeg (several run at once, so none of them may read the terminal)
+            result = subprocess.run(command, stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0 and result.stderr.strip():
+                if rich_available:
+                    console.print(f"[bold yellow]ffmpeg error for chunk {i+1}:[/bold yellow] {result.stderr.strip()}")
+                else:
+                    print(f"ffmpeg error for chunk {i+1}: {result.stderr.strip()}")
+            
+            # Check if the chunk was created
+            try:
+                chunk_size = os.stat(output_path).st_size / (1024 * 1024)  # Size in MB
+            except FileNotFoundError:
+                chunk_size = None
+            return output_path, start_time, chunk_size
+        
+        def add_chunk(i, output_path, start_time):
+            created[i] = output_path
+            if on_chunk:
+                on_chunk(output_path, start_time)
+        
+        # Chunks are independent, so several ffmpeg processes cut them at once;
+        # each finished chunk is handed on as soon as it is ready
+        workers = max(1, min(num_chunks, os.cpu_count() or 1, MAX_SPLIT_WORKERS))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {executor.submit(create_chunk, i): i for i in range(num_chunks)}
+            
+            if not rich_available:
+                print(f"Creating {num_chunks} chunks ({workers} at a time)...")
+            
+            for future in track_progress(as_completed(futures), num_chunks, f"Creating chunks ({workers} at a time)"):
+                i = futures[future]
+                output_path, start_time, chunk_size = future.result()
+                if chunk_size is not None:
+                    add_chunk(i, output_path, start_time)
+                    if rich_available:
                         console.print(f"Created chunk {i+1}: [green]{output_path}[/green] ({chunk_size:.2f} MB)")
-                        chunks.append(output_path)
                     else:
-                        console.print(f"[bold yellow]Warning:[/bold yellow] Failed to create chunk {i+1}")
-                    
-                    progress.update(task, advance=1)
-        else:
-            # Use tqdm if available, otherwise regular loop
-            iterator = tqdm(range(num_chunks), desc="Splitting audio") if tqdm_available else range(num_chunks)
-            
-            for i in iterator:
-                # Calculate start and end times for this chunk
-                start_time = i * chunk_duration_seconds
-                
-                # Create output path for this chunk
-                output_path = os.path.join(temp_dir, f"chunk_{i}.mp3")
-                
-                # Build ffmpeg command
-                command = [
-                    ffmpeg_path,
-                    "-i", audio_file,
-                    "-ss", str(start_time),
-                    "-t", str(chunk_duration_seconds),
-                    "-acodec", "libmp3lame",
-                    "-ab", "128k",
-                    "-ar", "44100",
-                    "-y",  # Overwrite output files without asking
-                    output_path
-                ]
-                
-                print(f"Creating chunk {i+1}/{num_chunks}...")
-                
-                # Run ffmpeg
-                subprocess.run(command, capture_output=True)
-                
-                # Check if the chunk was created
-                if os.path.exists(output_path):
-                    chunk_size = get_file_size(output_path) / (1024 * 1024)  # Size in MB
-                    print(f"Created chunk {i+1}: {output_path} ({chunk_size:.2f} MB)")
-                    chunks.append(output_path)
+                        print(f"Created chunk {i+1}/{num_chunks}: {output_path} ({chunk_size:.2f} MB)")
                 else:
-                    print(f"Warning: Failed to create chunk {i+1}")
+                    if rich_available:
+                        console.print(f"[bold yellow]Warning:[/bold yellow] Failed to create chunk {i+1}")
+                    else:
+                        print(f"Warning: Failed to create chunk {i+1}")
+        
+        chunks = [created[i] for i in sorted(created)]
         
         if chunks:
             if rich_available:
@@ -327,7 +478,7 @@ def split_audio_file_with_ffmpeg(audio_file, max_size=MAX_FILE_SIZE, chunk_durat
             print(f"Error splitting audio file: {str(e)}")
         return None
 
-def split_audio_file(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_CHUNK_DURATION):
+def split_audio_file(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_CHUNK_DURATION, output_dir=None):
     """
     Split an audio file into smaller chunks.
     
@@ -335,9 +486,11 @@ def split_audio_file(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_
         audio_file (str): Path to the audio file
         max_size (int): Maximum file size in bytes
         chunk_duration (int): Duration of each chunk in milliseconds
+        output_dir (str): Directory to write the chunks to (default: a new
+            temporary directory the caller is responsible for removing)
         
     Returns:
-        list: List of paths to the chunk files
+        list: List of paths to the chunk files, or None if ffmpeg could not split the file
     """
     try:
         # Check if file needs splitting
@@ -348,68 +501,29 @@ def split_audio_file(audio_file, max_size=MAX_FILE_SIZE, chunk_duration=DEFAULT_
             
         print(f"Audio file is too large ({file_size / (1024*1024):.2f} MB), splitting into chunks...")
         
-        # Try using ffmpeg directly first (more reliable)
-        ffmpeg_chunks = split_audio_file_with_ffmpeg(audio_file, max_size, chunk_duration)
-        if ffmpeg_chunks and len(ffmpeg_chunks) > 1:
-            return ffmpeg_chunks
-            
-        # If ffmpeg direct method failed, try with pydub
-        print("Trying to split with pydub...")
-        
-        # Set ffmpeg paths for pydub
-        ffmpeg_path, ffprobe_path = find_ffmpeg_tools()
-        if ffmpeg_path:
-            AudioSegment.converter = ffmpeg_path
-        if ffprobe_path:
-            AudioSegment.ffprobe = ffprobe_path
-            
-        # Load the audio file
-        audio = AudioSegment.from_file(audio_file)
-        total_duration = len(audio)
-        
-        # Create a temporary directory for chunks
-        temp_dir = tempfile.mkdtemp()
-        chunk_files = []
-        
-        # Split the audio into chunks
-        for i, start in enumerate(range(0, total_duration, chunk_duration)):
-            end = min(start + chunk_duration, total_duration)
-            chunk = audio[start:end]
-            
-            # Save the chunk to a temporary file
-            chunk_file = os.path.join(temp_dir, f"chunk_{i}.mp3")
-            chunk.export(chunk_file, format="mp3", bitrate="64k")
-            
-            # Check if the chunk is still too large
-            if get_file_size(chunk_file) > max_size:
-                print(f"Warning: Chunk {i} is still too large, reducing quality further...")
-                # Try with even lower quality
-                chunk.export(chunk_file, format="mp3", bitrate="32k", parameters=["-ac", "1"])
-                
-                # If still too large, skip this chunk
-                if get_file_size(chunk_file) > max_size:
-                    print(f"Warning: Chunk {i} is still too large even with reduced quality, skipping")
-                    os.remove(chunk_file)
-                    continue
-            
-            chunk_files.append(chunk_file)
-            print(f"Created chunk {i+1}: {chunk_file} ({get_file_size(chunk_file) / (1024*1024):.2f} MB)")
-        
-        print(f"Split audio into {len(chunk_files)} chunks")
-        return chunk_files
+        # A single chunk is a valid result for short, high-bitrate files
+        chunks = split_audio_file_with_ffmpeg(audio_file, max_size, chunk_duration, file_size=file_size, output_dir=output_dir)
+        if not chunks:
+            print("Error: Failed to split audio file with ffmpeg")
+            return None
+        return chunks
     
     except Exception as e:
         print(f"Error splitting audio file: {e}")
-        return [audio_file]  # Return original file if splitting fails
+        return None
 
-def transcribe_audio_chunk(audio_file, client, model="whisper-large-v3"):
+def transcribe_audio_chunk(audio_file, client, model="whisper-large-v3", use_cache=True):
     """
     Transcribe a single audio chunk.
     
+    Transcriptions are cached by the chunk's content hash, so re-running after
+    a partial failure only sends the chunks that weren't transcribed yet.
+    
     Args:
         audio_file (str): Path to the audio file
         client: Groq client instance
         model (str): Whisper model to use
+        use_cache (bool): Whether to read and write the chunk transcription cache
         
     Returns:
         dict or str: Transcribed text with timestamps if available, or plain text
@@ -423,71 +537,306 @@ def transcribe_audio_chunk(audio_file, client, model="whisper-large-v3"):
             print(f"Warning: File size ({file_size / (1024*1024):.2f} MB) exceeds Groq API limit ({MAX_FILE_SIZE / (1024*1024)} MB)")
             return None
         
-        # Open the audio file
-        with open(audio_file, "rb") as file:
-            file_content = file.read()
-            file_name = os.path.basename(audio_file)
-            
-            # Create a transcription of the audio file with timestamps
-            transcription = client.audio.transcriptions.create(
-                file=(file_name, file_content),
-                model=model,
-                response_format="verbose_json",  # Request verbose JSON format with timestamps
-                timestamp_granularities=["segment"]  # Explicitly request segment-level timestamps
-            )
+        audio_digest = hash_audio_file(audio_file) if use_cache else None
+        if audio_digest:
+            cached_transcript = load_cached_chunk(audio_digest, model)
+            if cached_transcript:
+                print(f"Using cached transcription for {os.path.basename(audio_file)}")
+                return cached_transcript
         
-        # Fix the response handling logic to prioritize checking for timestamps
-        if isinstance(transcription, dict) and 'segments' in transcription:
-            # Direct dictionary response with timestamps
-            transcript_data = transcription
-            print(f"Chunk transcription completed with timestamps: {len(transcript_data.get('text', ''))} characters (JSON format)")
-            return transcript_data
-        elif hasattr(transcription, 'segments') and hasattr(transcription, 'text'):
-            # Object with segments - convert to dictionary
-            segment_list = transcription.segments
-            if hasattr(segment_list, 'to_dict'):
-                segment_list = segment_list.to_dict()
-            elif hasattr(segment_list, 'to_list'):
-                segment_list = segment_list.to_list()
-                
-            transcript_data = {
-                'text': transcription.text,
-                'segments': segment_list
-            }
-            print(f"Chunk transcription completed with timestamps: {len(transcript_data['text'])} characters (object format)")
-            return transcript_data
-        elif hasattr(transcription, 'text'):
-            # Just text attribute without segments
-            transcript_text = transcription.text
-            print(f"Chunk transcription completed: {len(transcript_text)} characters (text format)")
-            return transcript_text
-        elif isinstance(transcription, str):
-            # Direct string response
-            transcript_text = transcription
-            print(f"Chunk transcription completed: {len(transcript_text)} characters (string format)")
-            return transcript_text
-        else:
-            # Try to convert to string or extract text in some other way
-            try:
-                # Try to get json representation first
-                if hasattr(transcription, 'model_dump_json'):
-                    json_data = json.loads(transcription.model_dump_json())
-                    if 'text' in json_data and 'segments' in json_data:
-                        print(f"Chunk transcription completed with timestamps: {len(json_data['text'])} characters (converted JSON)")
-                        return json_data
-            except Exception as conversion_error:
-                print(f"Error converting response to JSON: {conversion_error}")
-                
-            # Fall back to string conversion
-            transcript_text = str(transcription)
-            print(f"Chunk transcription completed: {len(transcript_text)} characters (converted format)")
-            return transcript_text
+        transcript = _transcribe_file(audio_file, client, model)
+        if transcript and audio_digest:
+            save_cached_chunk(audio_digest, model, transcript)
+        return transcript
     
     except Exception as e:
         print(f"Error transcribing chunk {audio_file}: {e}")
         return None
 
-def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3"):
+def _transcribe_file(audio_file, client, model):
+    """
+    Send an audio file to the API and convert the response to a transcript.
+    
+    Args:
+        audio_file (str): Path to the audio file
+        client: Groq client instance
+        model (str): Whisper model to use
+        
+    Returns:
+        dict or str: Transcribed text with timestamps if available, or plain text
+    """
+    # Open the audio file (the client streams it from disk while uploading)
+    with open(audio_file, "rb") as file:
+        file_name = os.path.basename(audio_file)
+        
+        # Create a transcription of the audio file with timestamps
+        transcription = client.audio.transcriptions.create(
+            file=(file_name, file),
+            model=model,
+            response_format="verbose_json",  # Request verbose JSON format with timestamps
+            timestamp_granularities=["segment"]  # Explicitly request segment-level timestamps
+        )
+    
+    # Fix the response handling logic to prioritize checking for timestamps
+    if isinstance(transcription, dict) and 'segments' in transcription:
+        # Direct dictionary response with timestamps
+        transcript_data = transcription
+        print(f"Chunk transcription completed with timestamps: {len(transcript_data.get('text', ''))} characters (JSON format)")
+        return transcript_data
+    elif hasattr(transcription, 'segments') and hasattr(transcription, 'text'):
+        # Object with segments - convert to dictionary
+        segment_list = transcription.segments
+        if hasattr(segment_list, 'to_dict'):
+            segment_list = segment_list.to_dict()
+        elif hasattr(segment_list, 'to_list'):
+            segment_list = segment_list.to_list()
+            
+        transcript_data = {
+            'text': transcription.text,
+            'segments': segment_list
+        }
+        print(f"Chunk transcription completed with timestamps: {len(transcript_data['text'])} characters (object format)")
+        return transcript_data
+    elif hasattr(transcription, 'text'):
+        # Just text attribute without segments
+        transcript_text = transcription.text
+        print(f"Chunk transcription completed: {len(transcript_text)} characters (text format)")
+        return transcript_text
+    elif isinstance(transcription, str):
+        # Direct string response
+        transcript_text = transcription
+        print(f"Chunk transcription completed: {len(transcript_text)} characters (string format)")
+        return transcript_text
+    else:
+        # Try to convert to string or extract text in some other way
+        try:
+            # Try to get json representation first
+            if hasattr(transcription, 'model_dump_json'):
+                json_data = json.loads(transcription.model_dump_json())
+                if 'text' in json_data and 'segments' in json_data:
+                    print(f"Chunk transcription completed with timestamps: {len(json_data['text'])} characters (converted JSON)")
+                    return json_data
+        except Exception as conversion_error:
+            print(f"Error converting response to JSON: {conversion_error}")
+            
+        # Fall back to string conversion
+        transcript_text = str(transcription)
+        print(f"Chunk transcription completed: {len(transcript_text)} characters (converted format)")
+        return transcript_text
+
+def collect_chunk_results(futures):
+    """
+    Wait for chunk transcriptions to finish, showing progress as they complete.
+    
+    Args:
+        futures (list): Futures of transcribe_audio_chunk calls, in chunk order
+        
+    Returns:
+        list: Transcript for each chunk in the original order (None where transcription failed)
+    """
+    results = [None] * len(futures)
+    indexes = {future: i for i, future in enumerate(futures)}
+    
+    for future in track_progress(as_completed(futures), len(futures), "Transcribing chunks"):
+        results[indexes[future]] = future.result()
+    
+    return results
+
+def merge_chunk_transcripts(chunk_results, chunk_starts):
+    """
+    Stitch the transcripts of overlapping chunks into one text and segment list.
+    
+    Consecutive texts are joined with _overlap_cut, and the segments are cut at
+    the same place: segments of the earlier chunk after the cut and segments of
+    the later chunk before it are dropped, and a segment that straddles the cut
+    keeps only its words on the kept side. Segment times are shifted to the
+    whole file and never go back before the end of the previous segment.
+    
+    Args:
+        chunk_results (list): Transcript of each chunk in time order (None where transcription failed)
+        chunk_starts (list): Start time of each chunk in seconds
+        
+    Returns:
+        tuple: (combined text, combined list of segments)
+    """
+    text_parts = []
+    combined_segments = []
+    covered_until = float('-inf')
+    # The latest chunk's segments wait here, with their offsets in text_parts[-1],
+    # until the next chunk decides where that text is cut
+    pending = []
+    
+    for i, (chunk_transcript, time_offset) in enumerate(zip(chunk_results, chunk_starts)):
+        if not chunk_transcript:
+            if rich_available:
+                console.print(f"[bold yellow]Warning:[/bold yellow] Failed to transcribe chunk {i+1}")
+            else:
+                print(f"Warning: Failed to transcribe chunk {i+1}")
+            continue
+        
+        is_object = isinstance(chunk_transcript, dict)
+        chunk_text = chunk_transcript['text'] if is_object and 'text' in chunk_transcript else str(chunk_transcript)
+        segments = chunk_transcript['segments'] if is_object and chunk_transcript.get('segments') else []
+        
+        if segments:
+            if rich_available:
+                console.print(f"Chunk {i+1} starts at [green]{time_offset:.2f}[/green] seconds")
+            else:
+                print(f"Chunk {i+1} starts at {time_offset:.2f} seconds")
+            
+            # Adjust segments with the chunk's start time
+            for segment in segments:
+                if isinstance(segment, dict):
+                    if 'start' in segment:
+                        segment['start'] += time_offset
+                    if 'end' in segment:
+                        segment['end'] += time_offset
+        
+        located = _locate_segments(segments, chunk_text)
+        
+        # Join the text to the previous chunk across the overlap. Only the previous
+        # chunk's text is aligned and trimmed, and the parts are joined once at
+        # the end, so merging stays linear
+        if text_parts:
+            text_end, next_start = _overlap_cut(text_parts[-1], chunk_text)
+            covered_until = _append_segments(
+                combined_segments, _clip_segments(pending, text_parts[-1], 0, text_end), covered_until
+            )
+            text_parts[-1] = text_parts[-1][:text_end]
+            located = _clip_segments(located, chunk_text, next_start, len(chunk_text))
+            chunk_text = chunk_text[next_start:]
+        
+        text_parts.append(chunk_text)
+        pending = located
+    
+    _append_segments(combined_segments, pending, covered_until)
+    
+    return "".join(text_parts), combined_segments
+
+def _locate_segments(segments, text):
+    """
+    Find the span of each segment's words in its chunk's text.
+    
+    Args:
+        segments (list): Segments of a chunk
+        text (str): Text of the same chunk
+        
+    Returns:
+        list: (segment, start, end) tuples; start and end are None for a
+            segment whose words are not found after the previous segment
+    """
+    located = []
+    cursor = 0
+    for segment in segments:
+        words = segment.get('text') if isinstance(segment, dict) else None
+        start = text.find(words.strip(), cursor) if isinstance(words, str) else -1
+        if start < 0:
+            located.append((segment, None, None))
+            continue
+        cursor = start + len(words.strip())
+        located.append((segment, start, cursor))
+    return located
+
+def _clip_segments(located, text, begin, end):
+    """
+    Keep the located segments that fall within text[begin:end], trimming the ones that straddle it.
+    
+    Args:
+        located (list): (segment, start, end) tuples from _locate_segments
+        text (str): Text the offsets refer to
+        begin (int): Start of the kept part of text
+        end (int): End of the kept part of text
+        
+    Returns:
+        list: (segment, start, end) tuples with offsets relative to text[begin:end]
+    """
+    clipped = []
+    for segment, start, stop in located:
+        if start is None:
+            clipped.append((segment, None, None))
+            continue
+        if stop <= begin or start >= end:
+            continue
+        if start < begin or stop > end:
+            start, stop = max(start, begin), min(stop, end)
+            words = text[start:stop].strip()
+            if not words:
+                continue
+            leading = segment['text'][:len(segment['text']) - len(segment['text'].lstrip())]
+            segment = {**segment, 'text': leading + words}
+        clipped.append((segment, start - begin, stop - begin))
+    return clipped
+
+def _append_segments(combined_segments, located, covered_until):
+    """
+    Add segments to the combined list so none starts before the previous one ends.
+    
+    Segments whose text could not be located are placed by time alone: those
+    starting inside the part already covered are dropped.
+    
+    Args:
+        combined_segments (list): Segments merged so far, extended in place
+        located (list): (segment, start, end) tuples to add, in order
+        covered_until (float): End time of the last merged segment
+        
+    Returns:
+        float: End time of the last merged segment after adding these
+    """
+    for segment, start, _ in located:
+        seg_start = segment.get('start') if isinstance(segment, dict) else None
+        seg_end = segment.get('end') if isinstance(segment, dict) else None
+        if seg_start is not None and seg_start < covered_until:
+            if start is None:
+                continue
+            segment = {**segment, 'start': covered_until}
+            if seg_end is not None and seg_end < covered_until:
+                segment['end'] = covered_until
+        combined_segments.append(segment)
+        if seg_end is not None:
+            covered_until = max(covered_until, segment['end'])
+    return covered_until
+
+def _overlap_cut(text, next_text, window=OVERLAP_MERGE_WORDS):
+    """
+    Find where to join the transcripts of two consecutive chunks whose audio overlaps.
+    
+    The last words of text and the first words of next_text are aligned on
+    their longest common run of words. The text is cut just before that run
+    and continued from the run in next_text, which drops the repeated words
+    and the word that may have been cut off at the end of the first chunk.
+    Without a run of at least two words the transcripts are simply concatenated.
+    
+    Args:
+        text (str): Transcript of the earlier chunk
+        next_text (str): Transcript of the next chunk
+        window (int): Number of words compared on each side of the boundary
+        
+    Returns:
+        tuple: (end of the kept part of text, start of the kept part of next_text)
+    """
+    if not text:
+        return 0, 0
+    
+    tail = list(_WORD_RE.finditer(text))[-window:]
+    head = list(itertools.islice(_WORD_RE.finditer(next_text), window))
+    
+    matcher = difflib.SequenceMatcher(
+        None,
+        [_normalize_word(match.group()) for match in tail],
+        [_normalize_word(match.group()) for match in head],
+        autojunk=False
+    )
+    tail_index, head_index, size = matcher.find_longest_match(0, len(tail), 0, len(head))
+    if size < 2:
+        return len(text), 0
+    
+    return tail[tail_index].start(), head[head_index].start()
+
+def _normalize_word(word):
+    """Lowercase a word and strip surrounding punctuation for overlap matching."""
+    return word.strip(string.punctuation).lower() or word
+
+def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3", concurrency=DEFAULT_TRANSCRIBE_CONCURRENCY, use_cache=True):
     """
     Transcribe audio file using Whisper API.
     
@@ -495,6 +844,8 @@ def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3"):
         audio_file (str): Path to the audio file
         api_key (str): API key for Groq (optional, can be loaded from .env)
         model (str): Whisper model to use
+        concurrency (int): Maximum number of chunks transcribed at once for large files
+        use_cache (bool): Whether to reuse and cache chunk transcriptions
         
     Returns:
         dict or str: Transcript as dictionary with timestamps (if available) or string
@@ -528,8 +879,8 @@ def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3"):
         else:
             print(f"Audio file size: {file_size_mb:.2f} MB")
             
-        # Initialize Groq client
-        client = Groq(api_key=api_key)
+        # Get the Groq client (shared between calls so connections are reused)
+        client = _get_client(api_key)
         
         # Check if file is too large
         if file_size > MAX_FILE_SIZE:
@@ -539,152 +890,35 @@ def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3"):
             else:
                 print(f"Audio file is too large ({file_size_mb:.2f} MB), splitting into chunks...")
                 
-            chunks = split_audio_file_with_ffmpeg(audio_file)
-            if not chunks:
-                if rich_available:
-                    console.print("[bold red]Error:[/bold red] Failed to split audio file")
-                else:
-                    print("Error: Failed to split audio file")
-                return None
-                
-            # Transcribe each chunk
-            chunk_transcripts = []
-            combined_text = ""
-            combined_segments = []
-            time_offset = 0
-            
             if rich_available:
-                console.print(f"Transcribing [green]{len(chunks)}[/green] audio chunks...")
-                
-                # Setup progress for transcription
-                with Progress(
-                    SpinnerColumn(),
-                    TextColumn("[bold green]Transcribing chunk {task.fields[chunk_num]}/{task.fields[total_chunks]}..."),
-                    BarColumn(),
-                    TaskProgressColumn(),
-                    TimeRemainingColumn(),
-                    console=console
-                ) as progress:
-                    task = progress.add_task("[green]Transcribing...", total=len(chunks), chunk_num=0, total_chunks=len(chunks))
-                    
-                    for i, chunk in enumerate(chunks):
-                        progress.update(task, advance=0, chunk_num=i+1)
-                        
-                        console.print(f"Transcribing chunk {i+1}/{len(chunks)}...")
-                        chunk_size = get_file_size(chunk) / (1024 * 1024)  # Size in MB
-                        console.print(f"Transcribing file of size: [green]{chunk_size:.2f} MB[/green]")
-                        
-                        # Wait a bit to avoid rate limits
-                        if i > 0:
-                            wait_time = 2
-                            console.print(f"Waiting [yellow]{wait_time}[/yellow] seconds before next API call...")
-                            time.sleep(wait_time)
-                        
-                        # Transcribe chunk
-                        chunk_transcript = transcribe_audio_chunk(chunk, client, model)
-                        
-                        if chunk_transcript:
-                            # Determine duration of this chunk to calculate next offset
-                            duration = 0
-                            is_object = isinstance(chunk_transcript, dict)
-                            
-                            if is_object and 'segments' in chunk_transcript and chunk_transcript['segments']:
-                                # Get duration from the end time of the last segment
-                                if isinstance(chunk_transcript['segments'][-1], dict) and 'end' in chunk_transcript['segments'][-1]:
-                                    duration = chunk_transcript['segments'][-1]['end']
-                                    console.print(f"Chunk duration: [green]{duration:.2f}[/green] seconds, new offset: [green]{time_offset + duration:.2f}[/green]")
-                                    
-                                    # Adjust segments with time offset
-                                    for segment in chunk_transcript['segments']:
-                                        if isinstance(segment, dict):
-                                            if 'start' in segment:
-                                                segment['start'] += time_offset
-                                            if 'end' in segment:
-                                                segment['end'] += time_offset
-                                    
-                                    # Add adjusted segments to combined segments
-                                    combined_segments.extend(chunk_transcript['segments'])
-                            
-                            chunk_transcripts.append(chunk_transcript)
-                            
-                            # Extract text
-                            chunk_text = chunk_transcript['text'] if is_object and 'text' in chunk_transcript else str(chunk_transcript)
-                            combined_text += chunk_text
-                            
-                            char_count = len(chunk_text)
-                            console.print(f"Chunk transcription completed: [green]{char_count}[/green] characters{'with timestamps' if is_object else ''}")
-                            
-                            # Update time offset for next chunk
-                            if is_object and duration > 0:
-                                time_offset += duration
-                        else:
-                            console.print(f"[bold yellow]Warning:[/bold yellow] Failed to transcribe chunk {i+1}")
-                            
-                        progress.update(task, advance=1)
+                console.print(f"Chunks are transcribed as soon as they are created ([green]{concurrency}[/green] at a time)")
             else:
-                # Use tqdm if available, otherwise regular loop
-                iterator = tqdm(enumerate(chunks), total=len(chunks), desc="Transcribing chunks") if tqdm_available else enumerate(chunks)
+                print(f"Chunks are transcribed as soon as they are created ({concurrency} at a time)")
+            
+            # Upload each chunk while ffmpeg encodes the next ones, then stitch
+            # the transcripts together in order. The chunks live in a temporary
+            # directory that is removed once the uploads finish, even on failure.
+            with tempfile.TemporaryDirectory(prefix="ytwa_chunks_") as chunk_dir, \
+                    ThreadPoolExecutor(max_workers=max(1, concurrency)) as executor:
+                submitted = []
+                
+                def submit_chunk(chunk, start_time):
+                    submitted.append((start_time, executor.submit(transcribe_audio_chunk, chunk, client, model, use_cache)))
                 
-                for i, chunk in iterator:
-                    print(f"Transcribing chunk {i+1}/{len(chunks)}...")
-                    chunk_size = get_file_size(chunk) / (1024 * 1024)  # Size in MB
-                    print(f"Transcribing file of size: {chunk_size:.2f} MB")
-                    
-                    # Wait a bit to avoid rate limits
-                    if i > 0:
-                        wait_time = 2
-                        print(f"Waiting {wait_time} seconds before next API call...")
-                        time.sleep(wait_time)
-                    
-                    # Transcribe chunk
-                    chunk_transcript = transcribe_audio_chunk(chunk, client, model)
-                    
-                    if chunk_transcript:
-                        # Determine duration of this chunk to calculate next offset
-                        duration = 0
-                        is_object = isinstance(chunk_transcript, dict)
-                        
-                        if is_object and 'segments' in chunk_transcript and chunk_transcript['segments']:
-                            # Get duration from the end time of the last segment
-                            if isinstance(chunk_transcript['segments'][-1], dict) and 'end' in chunk_transcript['segments'][-1]:
-                                duration = chunk_transcript['segments'][-1]['end']
-                                print(f"Chunk duration: {duration:.2f} seconds, new offset: {time_offset + duration:.2f}")
-                                
-                                # Adjust segments with time offset
-                                for segment in chunk_transcript['segments']:
-                                    if isinstance(segment, dict):
-                                        if 'start' in segment:
-                                            segment['start'] += time_offset
-                                        if 'end' in segment:
-                                            segment['end'] += time_offset
-                                
-                                # Add adjusted segments to combined segments
-                                combined_segments.extend(chunk_transcript['segments'])
-                        
-                        chunk_transcripts.append(chunk_transcript)
-                        
-                        # Extract text
-                        chunk_text = chunk_transcript['text'] if is_object and 'text' in chunk_transcript else str(chunk_transcript)
-                        combined_text += chunk_text
-                        
-                        char_count = len(chunk_text)
-                        print(f"Chunk transcription completed: {char_count} characters{'with timestamps' if is_object else ''}")
-                        
-                        # Update time offset for next chunk
-                        if is_object and duration > 0:
-                            time_offset += duration
+                chunks = split_audio_file_with_ffmpeg(audio_file, on_chunk=submit_chunk, file_size=file_size, output_dir=chunk_dir)
+                if not chunks:
+                    if rich_available:
+                        console.print("[bold red]Error:[/bold red] Failed to split audio file")
                     else:
-                        print(f"Warning: Failed to transcribe chunk {i+1}")
-            
-            # Clean up chunks
-            for chunk in chunks:
-                if os.path.exists(chunk):
-                    os.remove(chunk)
+                        print("Error: Failed to split audio file")
+                    return None
+                
+                # Chunks may be created out of order; stitch them in time order
+                submitted.sort(key=lambda item: item[0])
+                chunk_starts = [start_time for start_time, _ in submitted]
+                chunk_results = collect_chunk_results([future for _, future in submitted])
             
-            # Clean up temp directory
-            temp_dir = os.path.dirname(chunks[0]) if chunks else None
-            if temp_dir and os.path.exists(temp_dir):
-                os.rmdir(temp_dir)
+            combined_text, combined_segments = merge_chunk_transcripts(chunk_results, chunk_starts)
             
             # Check if we should return a structured object with timestamps
             if combined_segments:
@@ -706,10 +940,10 @@ def transcribe_audio(audio_file, api_key=None, model="whisper-large-v3"):
             # Transcribe the entire file at once
             if rich_available:
                 with console.status("[bold green]Transcribing audio...", spinner="dots"):
-                    transcript = transcribe_audio_chunk(audio_file, client, model)
+                    transcript = transcribe_audio_chunk(audio_file, client, model, use_cache)
             else:
                 print("Transcribing audio...")
-                transcript = transcribe_audio_chunk(audio_file, client, model)
+                transcript = transcribe_audio_chunk(audio_file, client, model, use_cache)
             
             if transcript:
                 if isinstance(transcript, dict) and 'text' in transcript:
@@ -762,39 +996,32 @@ def save_transcript(transcript, output_file):
         if isinstance(transcript, dict) and 'text' in transcript:
             # If output file ends with .txt, save just the text
             if output_file.endswith('.txt'):
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write(transcript['text'])
+                # Encode once and write bytes, skipping the text layer
+                with atomic_open(output_file, 'wb') as f:
+                    f.write(transcript['text'].encode('utf-8'))
                 print(f"Transcript text saved to: {output_file}")
                 
                 # Also save the full transcript with timestamps to a JSON file
                 json_file = output_file.replace('.txt', '.json')
                 
-                # Ensure all data is JSON serializable
-                json_safe_transcript = transcript.copy()
-                
-                # Handle potential non-serializable objects in segments
-                if 'segments' in json_safe_transcript:
-                    # Convert any special objects to dictionaries
-                    if isinstance(json_safe_transcript['segments'], list):
-                        for i, segment in enumerate(json_safe_transcript['segments']):
-                            if not isinstance(segment, dict):
-                                if hasattr(segment, 'to_dict'):
-                                    json_safe_transcript['segments'][i] = segment.to_dict()
-                                elif hasattr(segment, '__dict__'):
-                                    json_safe_transcript['segments'][i] = segment.__dict__
+                # Ensure all data is JSON serializable. Segments are normally
+                # dicts already; only rebuild the list (leaving the caller's
+                # transcript untouched) when some are SDK objects.
+                json_safe_transcript = transcript
+                segments = transcript.get('segments')
+                if isinstance(segments, list) and not all(isinstance(segment, dict) for segment in segments):
+                    json_safe_transcript = dict(transcript, segments=[_segment_to_dict(segment) for segment in segments])
                 
-                with open(json_file, 'w', encoding='utf-8') as f:
-                    json.dump(json_safe_transcript, f, indent=2, default=str)
+                write_json(json_safe_transcript, json_file, default=str)
                 print(f"Transcript with timestamps saved to: {json_file}")
             else:
                 # For other file types, save the entire transcript dictionary
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    json.dump(transcript, f, indent=2, default=str)
+                write_json(transcript, output_file, default=str)
                 print(f"Transcript with timestamps saved to: {output_file}")
         else:
             # Save plain text transcript
-            with open(output_file, 'w', encoding='utf-8') as f:
-                f.write(str(transcript))
+            with atomic_open(output_file, 'wb') as f:
+                f.write(str(transcript).encode('utf-8'))
             print(f"Transcript saved to: {output_file}")
         
         return True
@@ -802,6 +1029,16 @@ def save_transcript(transcript, output_file):
         print(f"Error saving transcript: {e}")
         return False
 
+def _segment_to_dict(segment):
+    """Convert a transcript segment to a dictionary if it is an SDK object."""
+    if isinstance(segment, dict):
+        return segment
+    if hasattr(segment, 'to_dict'):
+        return segment.to_dict()
+    if hasattr(segment, '__dict__'):
+        return segment.__dict__
+    return segment
+
 def load_transcript(transcript_file):
     """
     Load transcript from a local file.
@@ -813,18 +1050,13 @@ def load_transcript(transcript_file):
         str or dict: Transcript text or dictionary with text and timestamps
     """
     try:
-        if not os.path.exists(transcript_file):
-            print(f"Error: Transcript file not found: {transcript_file}")
-            return None
-            
         print(f"Loading transcript from: {transcript_file}")
         
         # Check if this is a JSON file with timestamps
         if transcript_file.endswith('.json'):
             try:
-                with open(transcript_file, 'r', encoding='utf-8') as f:
-                    transcript_data = json.load(f)
-                    
+                transcript_data = read_json(transcript_file)
+                
                 # Validate that it's a transcript with required fields
                 if isinstance(transcript_data, dict) and 'text' in transcript_data:
                     print(f"Loaded transcript with timestamps ({len(transcript_data['text'])} characters)")
@@ -850,6 +1082,9 @@ def load_transcript(transcript_file):
         print(f"Loaded plain text transcript ({len(transcript_text)} characters)")
         return transcript_text
         
+    except FileNotFoundError:
+        print(f"Error: Transcript file not found: {transcript_file}")
+        return None
     except Exception as e:
         print(f"Error loading transcript: {e}")
         return None
@@ -865,25 +1100,26 @@ def find_existing_transcript(video_id, output_dir="output"):
     Returns:
         str or None: Path to transcript file if found, None otherwise
     """
-    if not os.path.exists(output_dir):
+    # Scan the directory once, keeping the newest JSON and text transcript for the video
+    try:
+        entries = os.scandir(output_dir)
+    except FileNotFoundError:
         return None
-        
-    # Look for transcript files matching the pattern
-    transcript_pattern = f"transcript_{video_id}_*.json"
-    matching_json_files = list(Path(output_dir).glob(transcript_pattern))
-    
-    if matching_json_files:
-        # Use the most recent JSON file (with timestamps)
-        latest_file = max(matching_json_files, key=lambda x: x.stat().st_mtime)
-        return str(latest_file)
-    
-    # If no JSON files, try plain text
-    transcript_pattern = f"transcript_{video_id}_*.txt"
-    matching_txt_files = list(Path(output_dir).glob(transcript_pattern))
     
-    if matching_txt_files:
-        # Use the most recent text file
-        latest_file = max(matching_txt_files, key=lambda x: x.stat().st_mtime)
-        return str(latest_file)
+    prefix = f"transcript_{video_id}_"
+    latest = {'.json': None, '.txt': None}
+    latest_mtime = {'.json': None, '.txt': None}
+    with entries:
+        for entry in entries:
+            if not entry.name.startswith(prefix):
+                continue
+            ext = os.path.splitext(entry.name)[1]
+            if ext not in latest:
+                continue
+            mtime = entry.stat().st_mtime
+            if latest_mtime[ext] is None or mtime > latest_mtime[ext]:
+                latest[ext] = entry.path
+                latest_mtime[ext] = mtime
     
-    return None 
\ No newline at end of file
+    # Prefer the most recent JSON file (with timestamps), then plain text
+    return latest['.json'] or latest['.txt']
@@ -0,0 +1,53 @@
+"""
+Tests for stitching the transcripts of overlapping chunks.
+"""
+
+import pytest
+
+pytest.importorskip("groq")
+
+from src.transcriber import merge_chunk_transcripts
+
+
+def _chunk(segments):
+    """Build a chunk transcript the way the API returns it."""
+    return {
+        'text': "".join(text for _, _, text in segments),
+        'segments': [{'start': start, 'end': end, 'text': text} for start, end, text in segments]
+    }
+
+
+def test_overlapping_chunks_are_not_repeated():
+    # The second chunk starts 2 seconds before the first one ends, so it
+    # transcribes "the market and bought" a second time
+    first = _chunk([
+        (0.0, 4.0, " We went to the shops."),
+        (4.0, 10.0, " Then we walked to the market and bou"),
+    ])
+    second = _chunk([
+        (0.0, 3.0, " the market and bought some apples."),
+        (3.0, 6.0, " They were sweet."),
+    ])
+    
+    text, segments = merge_chunk_transcripts([first, second], [0, 8])
+    
+    assert text == " We went to the shops. Then we walked to the market and bought some apples. They were sweet."
+    assert "".join(segment['text'] for segment in segments) == text
+    
+    words = " ".join(segment['text'] for segment in segments).split()
+    assert words.count("market") == 1
+    
+    for previous, segment in zip(segments, segments[1:]):
+        assert segment['start'] >= previous['end']
+    assert segments[-1]['end'] == 14.0
+
+
+def test_chunks_without_common_words_are_concatenated():
+    first = _chunk([(0.0, 10.0, " One thing.")])
+    second = _chunk([(0.0, 5.0, " Another thing entirely.")])
+    
+    text, segments = merge_chunk_transcripts([first, None, second], [0, 8, 16])
+    
+    assert text == " One thing. Another thing entirely."
+    assert [segment['text'] for segment in segments] == [" One thing.", " Another thing entirely."]
+    assert [segment['start'] for segment in segments] == [0.0, 16.0]
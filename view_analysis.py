@@ -22,12 +22,13 @@ Example:
 """
 
 import os
+import re
 import sys
 import json
 import argparse
-import glob
 import datetime
-from src.formatter import format_results
+from concurrent.futures import ThreadPoolExecutor
+from src.formatter import format_results, read_json
 
 # Try to load required libraries
 try:
@@ -58,6 +59,12 @@ custom_style = Style([
 # Set up Rich console
 console = Console() if rich_available else None
 
+# Analysis files read at the same time when listing their keywords
+MAX_READ_WORKERS = 8
+
+# Raw analysis file names: analysis_VIDEO_ID_YYYYMMDD_HHMMSS_raw.json (video IDs may contain underscores)
+_ANALYSIS_FILE_RE = re.compile(r'^analysis_(.+)_(\d{8}_\d{6})_raw\.json$')
+
 def find_analysis_files(output_dir="output"):
     """
     Find all analysis result files in the specified directory.
@@ -66,18 +73,24 @@ def find_analysis_files(output_dir="output"):
         output_dir (str): Directory to search for analysis files
         
     Returns:
-        list: List of analysis file paths
+        list: Directory entries (os.DirEntry) of the analysis files, newest first
     """
-    # Check if directory exists
-    if not os.path.exists(output_dir):
+    # Find all raw analysis JSON files (analysis_*_raw.json). Directory entries
+    # cache their stat, so sorting and listing stat each file only once.
+    try:
+        entries = os.scandir(output_dir)
+    except FileNotFoundError:
         return []
     
-    # Find all raw analysis JSON files
-    pattern = os.path.join(output_dir, "analysis_*_raw.json")
-    files = glob.glob(pattern)
+    with entries:
+        files = [
+            entry for entry in entries
+            if entry.name.startswith("analysis_") and entry.name.endswith("_raw.json")
+            and len(entry.name) >= len("analysis__raw.json")
+        ]
     
     # Sort files by modification time (newest first)
-    files.sort(key=os.path.getmtime, reverse=True)
+    files.sort(key=lambda entry: entry.stat().st_mtime, reverse=True)
     
     return files
 
@@ -92,8 +105,7 @@ def extract_keywords_from_file(file_path):
         str: Comma-separated list of keywords
     """
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = read_json(file_path)
         
         if 'keywords' in data:
             keywords = list(data['keywords'].keys())
@@ -112,14 +124,9 @@ def get_video_info_from_filename(filename):
     Returns:
         tuple: (video_id, timestamp)
     """
-    basename = os.path.basename(filename)
-    # Format is analysis_VIDEO_ID_TIMESTAMP_raw.json
-    parts = basename.split('_')
-    
-    if len(parts) >= 4:
-        video_id = parts[1]
-        timestamp = '_'.join(parts[2:-1])  # Join all parts between video_id and _raw.json
-        return video_id, timestamp
+    match = _ANALYSIS_FILE_RE.match(os.path.basename(filename))
+    if match:
+        return match.group(1), match.group(2)
     
     return "unknown", "unknown"
 
@@ -155,17 +162,20 @@ def interactive_mode():
         console.print(f"[bold red]No analysis files found in {output_dir}[/bold red]")
         return None
     
+    # Read the keywords of all files at once; on slow or network drives the
+    # reads overlap instead of adding up
+    with ThreadPoolExecutor(max_workers=min(MAX_READ_WORKERS, len(files))) as executor:
+        file_keywords = list(executor.map(extract_keywords_from_file, [entry.path for entry in files]))
+    
     # Create formatted choices for each file
     choices = []
-    for file in files:
+    for entry, keywords in zip(files, file_keywords):
+        file = entry.path
         video_id, timestamp = get_video_info_from_filename(file)
-        # Try to get file size and formatted date
-        size_mb = os.path.getsize(file) / (1024 * 1024)
-        mod_time = os.path.getmtime(file)
-        mod_date = datetime.datetime.fromtimestamp(mod_time).strftime("%Y-%m-%d %H:%M:%S")
-        
-        # Extract keywords from the file
-        keywords = extract_keywords_from_file(file)
+        # Get file size and formatted date from the entry's cached stat
+        stat = entry.stat()
+        size_mb = stat.st_size / (1024 * 1024)
+        mod_date = datetime.datetime.fromtimestamp(stat.st_mtime).strftime("%Y-%m-%d %H:%M:%S")
         
         # Format the choice label
         label = f"{video_id} ({mod_date}) - {size_mb:.2f}MB - Keywords: {keywords}"
@@ -232,18 +242,9 @@ Examples:
             parser.print_help()
             return 1
     
-    # Check if file exists
-    if not os.path.exists(file_path):
-        if rich_available:
-            console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
-        else:
-            print(f"Error: File not found: {file_path}")
-        return 1
-    
     # Load the analysis results
     try:
-        with open(file_path, 'r', encoding='utf-8') as f:
-            analysis_results = json.load(f)
+        analysis_results = read_json(file_path)
         
         # Handle timestamps which might have been serialized as strings
         if 'keywords' in analysis_results:
@@ -265,6 +266,12 @@ Examples:
         print("\n" + formatted_results)
         
         return 0
+    except FileNotFoundError:
+        if rich_available:
+            console.print(f"[bold red]Error: File not found: {file_path}[/bold red]")
+        else:
+            print(f"Error: File not found: {file_path}")
+        return 1
     except json.JSONDecodeError:
         if rich_available:
             console.print(f"[bold red]Error: File is not valid JSON: {file_path}[/bold red]")